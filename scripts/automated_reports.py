@@ -193,7 +193,7 @@ class AutomatedReportGenerator:
                     # This is just for demonstration
                     player_name = hot_players[0]["name"]
                     dates = [(datetime.now() - timedelta(days=x)).strftime("%Y-%m-%d") for x in range(14, -1, -1)]
-                    values = [0.250 + 0.003 * x + np.random.normal(0, 0.02) for x in range(15)]
+                    values = 0.250 + 0.003 * np.arange(15) + np.random.normal(0, 0.02, 15)
                     trend_path = self.trend_visualizer.visualize_player_trend(
                         player_name, "AVG", values, dates, filename=f"trend_{player_name.replace(' ', '_').lower()}_{today}.png")
                     attachments.append(trend_path)
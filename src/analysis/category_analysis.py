@@ -22,8 +22,12 @@ class CategoryAnalyzer:
         self.teams = teams
         self.team_dfs = {}
         self.league_stats = {}
+        self.category_scores = {}
         self.categories = {}
         
+        # Per-team analysis results, reset whenever teams are (re)processed
+        self._analysis_cache = {}
+        
         if teams:
             self._process_teams()
     
@@ -40,6 +44,7 @@ class CategoryAnalyzer:
     def _process_teams(self):
         """Process teams into DataFrames and calculate league stats."""
         self.team_dfs = {}
+        self.clear_cache()
         
         # Process each team's roster
         for team in self.teams:
@@ -131,65 +136,131 @@ class CategoryAnalyzer:
             'batting': {},
             'pitching': {}
         }
+        self.category_scores = {
+            'batting': {},
+            'pitching': {}
+        }
+        
+        # Split each roster into batters and pitchers once
+        batters_by_team = {}
+        pitchers_by_team = {}
+        for team_id, team_df in self.team_dfs.items():
+            is_pitcher = team_df['positions'].str.contains('SP|RP', case=False)
+            batters_by_team[team_id] = team_df[~is_pitcher]
+            pitchers_by_team[team_id] = team_df[is_pitcher]
         
         # For each batting category
         for cat_name, col_name in self.categories['batting'].items():
+            team_ids = []
             values = []
-            for team_df in self.team_dfs.values():
-                if col_name in team_df.columns:
-                    # Filter for batters
-                    batters = team_df[~team_df['positions'].str.contains('SP|RP', case=False)]
-                    if not batters.empty:
-                        values.append(batters[col_name].sum())
+            for team_id, batters in batters_by_team.items():
+                if col_name in batters.columns and not batters.empty:
+                    team_ids.append(team_id)
+                    values.append(batters[col_name].sum())
             
             if values:
-                self.league_stats['batting'][cat_name] = {
-                    'mean': np.mean(values),
-                    'median': np.median(values),
-                    'std': np.std(values),
-                    'min': np.min(values),
-                    'max': np.max(values)
-                }
+                self.league_stats['batting'][cat_name] = self._summarize_values(values)
+                self.category_scores['batting'][cat_name] = self._score_values(
+                    team_ids, values, self.league_stats['batting'][cat_name]
+                )
         
         # For each pitching category
         for cat_name, col_name in self.categories['pitching'].items():
+            team_ids = []
             values = []
-            for team_df in self.team_dfs.values():
-                if col_name in team_df.columns:
-                    # Filter for pitchers
-                    pitchers = team_df[team_df['positions'].str.contains('SP|RP', case=False)]
-                    if not pitchers.empty:
-                        # For rate stats (ERA, WHIP), calculate the team aggregate value
-                        if cat_name in ['ERA', 'WHIP', 'K/9', 'BB/9', 'K/BB']:
-                            # Simple average for demonstration - in reality this would use weights
-                            values.append(pitchers[col_name].mean())
-                        else:
-                            values.append(pitchers[col_name].sum())
+            for team_id, pitchers in pitchers_by_team.items():
+                if col_name in pitchers.columns and not pitchers.empty:
+                    team_ids.append(team_id)
+                    # For rate stats (ERA, WHIP), calculate the team aggregate value
+                    if cat_name in ['ERA', 'WHIP', 'K/9', 'BB/9', 'K/BB']:
+                        # Simple average for demonstration - in reality this would use weights
+                        values.append(pitchers[col_name].mean())
+                    else:
+                        values.append(pitchers[col_name].sum())
             
             if values:
-                self.league_stats['pitching'][cat_name] = {
-                    'mean': np.mean(values),
-                    'median': np.median(values),
-                    'std': np.std(values),
-                    'min': np.min(values),
-                    'max': np.max(values)
-                }
+                self.league_stats['pitching'][cat_name] = self._summarize_values(values)
+                # For ERA, WHIP, BB/9 lower is better
+                self.category_scores['pitching'][cat_name] = self._score_values(
+                    team_ids, values, self.league_stats['pitching'][cat_name],
+                    lower_is_better=cat_name in ['ERA', 'WHIP', 'BB/9']
+                )
+    
+    @staticmethod
+    def _summarize_values(values: List[float]) -> Dict[str, float]:
+        """
+        Summarize one category's values across the league.
+        
+        Args:
+            values: Team values for the category
+            
+        Returns:
+            Dict: Mean, median, std, min and max of the values
+        """
+        return {
+            'mean': np.mean(values),
+            'median': np.median(values),
+            'std': np.std(values),
+            'min': np.min(values),
+            'max': np.max(values)
+        }
+    
+    @staticmethod
+    def _score_values(
+        team_ids: List[int], values: List[float], league_stats: Dict[str, float],
+        lower_is_better: bool = False
+    ) -> Dict[int, Tuple[float, float, float]]:
+        """
+        Calculate z-scores and percentiles for every team in one category.
+        
+        Args:
+            team_ids: Team IDs, aligned with values
+            values: Team values for the category
+            league_stats: League summary from _summarize_values()
+            lower_is_better: Whether smaller values are stronger (e.g. ERA)
+            
+        Returns:
+            Dict: Team ID mapped to (value, z_score, percentile)
+        """
+        if league_stats['std'] > 0:
+            z_scores = (np.asarray(values, dtype=np.float64) - league_stats['mean']) / league_stats['std']
+            if lower_is_better:
+                z_scores = -z_scores
+        else:
+            z_scores = np.zeros(len(values))
+        
+        # Calculate percentile (rough approximation)
+        percentiles = np.clip((z_scores + 3) / 6, 0, 1) * 100
+        
+        return {
+            team_id: (value, z_score, percentile)
+            for team_id, value, z_score, percentile in zip(team_ids, values, z_scores, percentiles)
+        }
+    
+    def clear_cache(self):
+        """Forget memoized team analyses (e.g. after rosters or stats change)."""
+        self._analysis_cache = {}
     
     def analyze_team_categories(self, team_id: int) -> Dict[str, Any]:
         """
         Analyze a team's performance in each category.
         
+        Results are memoized per team until the teams are reprocessed or
+        clear_cache() is called; treat the returned dict as read-only.
+        
         Args:
             team_id: Team ID to analyze
             
         Returns:
             Dict: Analysis of team's categorical strengths and weaknesses
         """
+        cached = self._analysis_cache.get(team_id)
+        if cached is not None:
+            return cached
+        
         if not self.teams or team_id not in self.team_dfs or not self.categories:
             return {"error": "Team data not available"}
         
-        team_df = self.team_dfs[team_id]
-        
         # Find the team object
         team = next((t for t in self.teams if t.team_id == team_id), None)
         if not team:
@@ -204,104 +275,71 @@ class CategoryAnalyzer:
             }
         }
         
-        # Analyze batting categories
-        for cat_name, col_name in self.categories['batting'].items():
-            if col_name in team_df.columns and cat_name in self.league_stats['batting']:
-                # Filter for batters
-                batters = team_df[~team_df['positions'].str.contains('SP|RP', case=False)]
-                
-                if not batters.empty:
-                    # Get team value
-                    team_value = batters[col_name].sum()
-                    
-                    # Get league stats
-                    league_stats = self.league_stats['batting'][cat_name]
-                    
-                    # Calculate z-score
-                    if league_stats['std'] > 0:
-                        z_score = (team_value - league_stats['mean']) / league_stats['std']
-                    else:
-                        z_score = 0
-                    
-                    # Calculate percentile (rough approximation)
-                    percentile = min(max((z_score + 3) / 6, 0), 1) * 100
-                    
-                    # Determine strength level
-                    if percentile >= 80:
-                        strength = "Very Strong"
-                    elif percentile >= 60:
-                        strength = "Strong"
-                    elif percentile >= 40:
-                        strength = "Average"
-                    elif percentile >= 20:
-                        strength = "Weak"
-                    else:
-                        strength = "Very Weak"
-                    
-                    # Add to result
-                    result["categories"]["batting"][cat_name] = {
-                        "value": team_value,
-                        "league_mean": league_stats['mean'],
-                        "league_median": league_stats['median'],
-                        "z_score": z_score,
-                        "percentile": percentile,
-                        "strength": strength
-                    }
-        
-        # Analyze pitching categories
-        for cat_name, col_name in self.categories['pitching'].items():
-            if col_name in team_df.columns and cat_name in self.league_stats['pitching']:
-                # Filter for pitchers
-                pitchers = team_df[team_df['positions'].str.contains('SP|RP', case=False)]
-                
-                if not pitchers.empty:
-                    # Get team value (rate vs. counting stats)
-                    if cat_name in ['ERA', 'WHIP', 'K/9', 'BB/9', 'K/BB']:
-                        team_value = pitchers[col_name].mean()
-                    else:
-                        team_value = pitchers[col_name].sum()
-                    
-                    # Get league stats
-                    league_stats = self.league_stats['pitching'][cat_name]
-                    
-                    # Calculate z-score (note: for ERA, WHIP, BB/9 lower is better)
-                    if league_stats['std'] > 0:
-                        if cat_name in ['ERA', 'WHIP', 'BB/9']:
-                            z_score = -1 * (team_value - league_stats['mean']) / league_stats['std']
-                        else:
-                            z_score = (team_value - league_stats['mean']) / league_stats['std']
-                    else:
-                        z_score = 0
-                    
-                    # Calculate percentile (rough approximation)
-                    percentile = min(max((z_score + 3) / 6, 0), 1) * 100
-                    
-                    # Determine strength level
-                    if percentile >= 80:
-                        strength = "Very Strong"
-                    elif percentile >= 60:
-                        strength = "Strong"
-                    elif percentile >= 40:
-                        strength = "Average"
-                    elif percentile >= 20:
-                        strength = "Weak"
-                    else:
-                        strength = "Very Weak"
-                    
-                    # Add to result
-                    result["categories"]["pitching"][cat_name] = {
-                        "value": team_value,
-                        "league_mean": league_stats['mean'],
-                        "league_median": league_stats['median'],
-                        "z_score": z_score,
-                        "percentile": percentile,
-                        "strength": strength
-                    }
+        # Analyze batting categories using the league-wide scores
+        for cat_name, scores in self.category_scores['batting'].items():
+            if team_id not in scores:
+                continue
+            
+            team_value, z_score, percentile = scores[team_id]
+            league_stats = self.league_stats['batting'][cat_name]
+            
+            # Determine strength level
+            if percentile >= 80:
+                strength = "Very Strong"
+            elif percentile >= 60:
+                strength = "Strong"
+            elif percentile >= 40:
+                strength = "Average"
+            elif percentile >= 20:
+                strength = "Weak"
+            else:
+                strength = "Very Weak"
+            
+            # Add to result
+            result["categories"]["batting"][cat_name] = {
+                "value": team_value,
+                "league_mean": league_stats['mean'],
+                "league_median": league_stats['median'],
+                "z_score": z_score,
+                "percentile": percentile,
+                "strength": strength
+            }
+        
+        # Analyze pitching categories using the league-wide scores
+        for cat_name, scores in self.category_scores['pitching'].items():
+            if team_id not in scores:
+                continue
+            
+            team_value, z_score, percentile = scores[team_id]
+            league_stats = self.league_stats['pitching'][cat_name]
+            
+            # Determine strength level
+            if percentile >= 80:
+                strength = "Very Strong"
+            elif percentile >= 60:
+                strength = "Strong"
+            elif percentile >= 40:
+                strength = "Average"
+            elif percentile >= 20:
+                strength = "Weak"
+            else:
+                strength = "Very Weak"
+            
+            # Add to result
+            result["categories"]["pitching"][cat_name] = {
+                "value": team_value,
+                "league_mean": league_stats['mean'],
+                "league_median": league_stats['median'],
+                "z_score": z_score,
+                "percentile": percentile,
+                "strength": strength
+            }
         
         # Identify strength/weakness vectors
         result["strengths"] = self._identify_strengths(result["categories"])
         result["weaknesses"] = self._identify_weaknesses(result["categories"])
         
+        self._analysis_cache[team_id] = result
         return result
     
     def _identify_strengths(self, categories: Dict[str, Dict[str, Dict[str, Any]]]) -> Dict[str, List[str]]:
@@ -21,6 +21,9 @@ class TeamAnalyzer:
         self.teams = teams
         self.team_df = TeamDataProcessor.teams_to_dataframe(teams)
         
+        # Cache for derived data; team metadata is fixed after construction
+        self._division_standings = None
+        
     def get_standings(self) -> pd.DataFrame:
         """
         Get current league standings.
@@ -39,9 +42,13 @@ class TeamAnalyzer:
         Returns:
             dict: Dictionary with division names as keys and DataFrames as values
         """
+        if self._division_standings is not None:
+            return self._division_standings
+        
         if 'division_name' not in self.team_df.columns or self.team_df['division_name'].isna().all():
             logger.warning("No division information available")
-            return {}
+            self._division_standings = {}
+            return self._division_standings
         
         divisions = {}
         for division_name, group in self.team_df.groupby('division_name'):
@@ -50,7 +57,8 @@ class TeamAnalyzer:
                     ['name', 'owner_name', 'standing', 'wins', 'losses', 'win_percentage']
                 ]
         
-        return divisions
+        self._division_standings = divisions
+        return self._division_standings
     
     def get_team_by_name(self, name: str) -> pd.Series:
         """
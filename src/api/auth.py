@@ -35,7 +35,8 @@ class ESPNAuth:
             # Check if credentials have expired
             if 'expiry' in credentials:
                 expiry = datetime.datetime.fromisoformat(credentials['expiry'])
-                if expiry < datetime.datetime.now():
+                # Older files store a naive local timestamp; compare like with like
+                if expiry < datetime.datetime.now(expiry.tzinfo):
                     logger.warning("Credentials have expired")
                     return None
                     
@@ -57,7 +58,8 @@ class ESPNAuth:
             bool: True if successful, False otherwise
         """
         try:
-            expiry = datetime.datetime.now() + datetime.timedelta(days=expiry_days)
+            now = datetime.datetime.now(datetime.timezone.utc)
+            expiry = now + datetime.timedelta(days=expiry_days)
             
             credentials = {
                 'ESPN_S2': espn_s2,
@@ -65,8 +67,14 @@ class ESPNAuth:
                 'expiry': expiry.isoformat()
             }
             
-            with open(self.credentials_file, 'w') as f:
+            # Write to a temporary file and swap it in so a crash mid-write
+            # never leaves a truncated credentials file behind
+            tmp_file = f"{self.credentials_file}.tmp"
+            with open(tmp_file, 'w') as f:
                 json.dump(credentials, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.credentials_file)
                 
             logger.info(f"Credentials saved to {self.credentials_file}")
             return True
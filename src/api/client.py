@@ -21,6 +21,7 @@ class ESPNFantasyClient:
         self.espn_s2 = espn_s2
         self.swid = swid
         self.league = None
+        self._logged_team_attrs = False
         
     def connect(self):
         """
@@ -36,6 +37,7 @@ class ESPNFantasyClient:
                 espn_s2=self.espn_s2,
                 swid=self.swid
             )
+            self._logged_team_attrs = False
             logger.info(f"Connected to ESPN Fantasy Baseball league {self.league_id} for year {self.year}")
             return True
         except Exception as e:
@@ -83,11 +85,13 @@ class ESPNFantasyClient:
         if not self.league:
             self.connect()
         
-        # Let's print some debugging info about the team object structure
-        if self.league.teams and len(self.league.teams) > 0:
-            first_team = self.league.teams[0]
-            team_attrs = [attr for attr in dir(first_team) if not attr.startswith('_')]
-            logger.debug(f"Team attributes: {', '.join(team_attrs)}")
+        # Log the team object structure once per connection, and only when debugging
+        if not self._logged_team_attrs and self.league.teams:
+            self._logged_team_attrs = True
+            if logger.isEnabledFor(logging.DEBUG):
+                first_team = self.league.teams[0]
+                team_attrs = [attr for attr in dir(first_team) if not attr.startswith('_')]
+                logger.debug(f"Team attributes: {', '.join(team_attrs)}")
         
         return self.league.teams
     
@@ -9,18 +9,109 @@ https://statsapi.mlb.com/api/v1/
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from datetime import date as date_type, datetime, timedelta
+from typing import Dict, List, Any, Optional, Union
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# These are placeholder values and would be updated with actual data
+# in a production system
+_BALLPARK_FACTORS = {
+    "Yankee Stadium": 1.12,
+    "Fenway Park": 1.25,
+    "Tropicana Field": 0.94,
+    "Camden Yards": 1.05,
+    "Rogers Centre": 1.03,
+    "Dodger Stadium": 0.98,
+    "Oracle Park": 0.90,
+    "Petco Park": 0.93,
+    "Chase Field": 1.08,
+    "Coors Field": 1.38,
+    "Truist Park": 1.02,
+    "Citi Field": 0.96,
+    "Citizens Bank Park": 1.15,
+    "Nationals Park": 1.00,
+    "LoanDepot Park": 0.92,
+    "Wrigley Field": 1.04,
+    "Guaranteed Rate Field": 1.10,
+    "Great American Ball Park": 1.11,
+    "American Family Field": 1.05,
+    "Busch Stadium": 0.98,
+    "PNC Park": 0.91,
+    "Minute Maid Park": 1.08,
+    "Globe Life Field": 0.97,
+    "Angel Stadium": 0.97,
+    "Oakland Coliseum": 0.93,
+    "T-Mobile Park": 0.94,
+    "Progressive Field": 0.98,
+    "Comerica Park": 0.95,
+    "Kauffman Stadium": 0.98,
+    "Target Field": 1.00
+}
+
+# These are placeholder values and would be calculated dynamically
+# in a production system
+_TEAM_RATINGS = {
+    "NYY": {"offensive": 112, "strikeout_rate": 22.5, "walk_rate": 9.8},
+    "BOS": {"offensive": 108, "strikeout_rate": 21.0, "walk_rate": 8.5},
+    "TB": {"offensive": 103, "strikeout_rate": 24.2, "walk_rate": 8.9},
+    "BAL": {"offensive": 96, "strikeout_rate": 23.8, "walk_rate": 7.5},
+    "TOR": {"offensive": 105, "strikeout_rate": 20.5, "walk_rate": 8.2},
+    "LAD": {"offensive": 115, "strikeout_rate": 20.8, "walk_rate": 10.3},
+    "SF": {"offensive": 101, "strikeout_rate": 23.1, "walk_rate": 9.5},
+    "SD": {"offensive": 103, "strikeout_rate": 22.7, "walk_rate": 8.8},
+    "ARI": {"offensive": 100, "strikeout_rate": 22.3, "walk_rate": 8.2},
+    "COL": {"offensive": 95, "strikeout_rate": 24.5, "walk_rate": 7.3},
+    "ATL": {"offensive": 110, "strikeout_rate": 23.1, "walk_rate": 8.7},
+    "NYM": {"offensive": 102, "strikeout_rate": 21.9, "walk_rate": 8.4},
+    "PHI": {"offensive": 106, "strikeout_rate": 22.7, "walk_rate": 8.9},
+    "WSH": {"offensive": 94, "strikeout_rate": 20.8, "walk_rate": 7.6},
+    "MIA": {"offensive": 90, "strikeout_rate": 25.3, "walk_rate": 7.1},
+    "CHC": {"offensive": 98, "strikeout_rate": 24.1, "walk_rate": 8.3},
+    "CIN": {"offensive": 101, "strikeout_rate": 23.5, "walk_rate": 8.5},
+    "MIL": {"offensive": 100, "strikeout_rate": 23.8, "walk_rate": 9.1},
+    "PIT": {"offensive": 92, "strikeout_rate": 24.2, "walk_rate": 7.5},
+    "STL": {"offensive": 102, "strikeout_rate": 19.8, "walk_rate": 8.7},
+    "HOU": {"offensive": 108, "strikeout_rate": 19.5, "walk_rate": 9.3},
+    "TEX": {"offensive": 105, "strikeout_rate": 23.1, "walk_rate": 8.2},
+    "LAA": {"offensive": 100, "strikeout_rate": 24.7, "walk_rate": 7.9},
+    "OAK": {"offensive": 88, "strikeout_rate": 24.9, "walk_rate": 7.3},
+    "SEA": {"offensive": 97, "strikeout_rate": 25.6, "walk_rate": 8.8},
+    "CLE": {"offensive": 99, "strikeout_rate": 21.2, "walk_rate": 7.9},
+    "DET": {"offensive": 93, "strikeout_rate": 23.8, "walk_rate": 7.3},
+    "KC": {"offensive": 95, "strikeout_rate": 22.1, "walk_rate": 7.1},
+    "MIN": {"offensive": 102, "strikeout_rate": 22.9, "walk_rate": 8.7},
+    "CWS": {"offensive": 97, "strikeout_rate": 23.5, "walk_rate": 7.6}
+}
+
+
+@lru_cache(maxsize=1)
+def _ballpark_factors_series() -> pd.Series:
+    """Build the ballpark factor lookup table once per process."""
+    series = pd.Series(_BALLPARK_FACTORS, name='park_factor', dtype='float32')
+    series.index = pd.CategoricalIndex(series.index, name='ballpark')
+    return series
+
+
+@lru_cache(maxsize=1)
+def _team_ratings_frame() -> pd.DataFrame:
+    """Build the team ratings lookup table once per process."""
+    df = pd.DataFrame.from_dict(_TEAM_RATINGS, orient='index').astype('float32')
+    df.index = pd.CategoricalIndex(df.index, name='team')
+    return df
+
+
 class MLBStatsClient:
     """Client for the MLB Stats API."""
     
     BASE_URL = "https://statsapi.mlb.com/api/v1"
+    REQUEST_TIMEOUT = 10
     
     def __init__(self, cache_duration: int = 3600):
         """
@@ -31,6 +122,12 @@ class MLBStatsClient:
         """
         self.cache = {}
         self.cache_duration = cache_duration
+        
+        # Reuse one keep-alive connection pool for every request to the API
+        self.session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retries)
+        self.session.mount("https://", adapter)
     
     def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -44,31 +141,54 @@ class MLBStatsClient:
             Dict: API response as JSON
         """
         # Check cache first
-        cache_key = f"{endpoint}:{str(params)}"
-        if cache_key in self.cache:
-            cache_time, cache_data = self.cache[cache_key]
+        # Canonical key so logically equal params hit the same entry regardless of order
+        cache_key = (endpoint, tuple(sorted((params or {}).items())))
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            cache_time, cache_data, _ = cached
             if time.time() - cache_time < self.cache_duration:
                 logger.debug(f"Using cached data for {endpoint}")
                 return cache_data
         
+        # Revalidate stale entries with a conditional GET so unchanged
+        # resources come back as an empty 304 instead of a full payload
+        headers = {}
+        if cached is not None:
+            validators = cached[2]
+            if validators.get('ETag'):
+                headers['If-None-Match'] = validators['ETag']
+            if validators.get('Last-Modified'):
+                headers['If-Modified-Since'] = validators['Last-Modified']
+        
         # Make the request
         url = f"{self.BASE_URL}{endpoint}"
         
         try:
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params, headers=headers,
+                                        timeout=self.REQUEST_TIMEOUT)
+            
+            if response.status_code == 304 and cached is not None:
+                logger.debug(f"Cached data for {endpoint} not modified")
+                self.cache[cache_key] = (time.time(), cached[1], cached[2])
+                return cached[1]
+            
             response.raise_for_status()
             
             data = response.json()
             
-            # Cache the response
-            self.cache[cache_key] = (time.time(), data)
+            # Cache the response along with its validators
+            validators = {
+                'ETag': response.headers.get('ETag'),
+                'Last-Modified': response.headers.get('Last-Modified')
+            }
+            self.cache[cache_key] = (time.time(), data, validators)
             
             return data
         except requests.exceptions.RequestException as e:
             logger.error(f"Error making request to MLB API: {e}")
             return {}
     
-    def get_schedule(self, date: Optional[datetime] = None, 
+    def get_schedule(self, date: Optional[Union[datetime, date_type]] = None, 
                     team_id: Optional[int] = None, 
                     sport_id: int = 1) -> Dict[str, Any]:
         """
@@ -97,7 +217,7 @@ class MLBStatsClient:
             
         return self._make_request("/schedule", params)
     
-    def get_probable_pitchers(self, date: Optional[datetime] = None, 
+    def get_probable_pitchers(self, date: Optional[Union[datetime, date_type]] = None, 
                              team_id: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
         """
         Get probable pitchers for a specific date.
@@ -215,40 +335,7 @@ class MLBStatsClient:
         Returns:
             Dict: Ballpark factors (park name -> factor)
         """
-        # These are placeholder values and would be updated with actual data
-        # in a production system
-        return {
-            "Yankee Stadium": 1.12,
-            "Fenway Park": 1.25,
-            "Tropicana Field": 0.94,
-            "Camden Yards": 1.05,
-            "Rogers Centre": 1.03,
-            "Dodger Stadium": 0.98,
-            "Oracle Park": 0.90,
-            "Petco Park": 0.93,
-            "Chase Field": 1.08,
-            "Coors Field": 1.38,
-            "Truist Park": 1.02,
-            "Citi Field": 0.96,
-            "Citizens Bank Park": 1.15,
-            "Nationals Park": 1.00,
-            "LoanDepot Park": 0.92,
-            "Wrigley Field": 1.04,
-            "Guaranteed Rate Field": 1.10,
-            "Great American Ball Park": 1.11,
-            "American Family Field": 1.05,
-            "Busch Stadium": 0.98,
-            "PNC Park": 0.91,
-            "Minute Maid Park": 1.08,
-            "Globe Life Field": 0.97,
-            "Angel Stadium": 0.97,
-            "Oakland Coliseum": 0.93,
-            "T-Mobile Park": 0.94,
-            "Progressive Field": 0.98,
-            "Comerica Park": 0.95,
-            "Kauffman Stadium": 0.98,
-            "Target Field": 1.00
-        }
+        return dict(_BALLPARK_FACTORS)
     
     def get_team_ratings(self) -> Dict[str, Dict[str, float]]:
         """
@@ -260,40 +347,29 @@ class MLBStatsClient:
         Returns:
             Dict: Team ratings (team abbrev -> ratings)
         """
-        # These are placeholder values and would be calculated dynamically
-        # in a production system
-        return {
-            "NYY": {"offensive": 112, "strikeout_rate": 22.5, "walk_rate": 9.8},
-            "BOS": {"offensive": 108, "strikeout_rate": 21.0, "walk_rate": 8.5},
-            "TB": {"offensive": 103, "strikeout_rate": 24.2, "walk_rate": 8.9},
-            "BAL": {"offensive": 96, "strikeout_rate": 23.8, "walk_rate": 7.5},
-            "TOR": {"offensive": 105, "strikeout_rate": 20.5, "walk_rate": 8.2},
-            "LAD": {"offensive": 115, "strikeout_rate": 20.8, "walk_rate": 10.3},
-            "SF": {"offensive": 101, "strikeout_rate": 23.1, "walk_rate": 9.5},
-            "SD": {"offensive": 103, "strikeout_rate": 22.7, "walk_rate": 8.8},
-            "ARI": {"offensive": 100, "strikeout_rate": 22.3, "walk_rate": 8.2},
-            "COL": {"offensive": 95, "strikeout_rate": 24.5, "walk_rate": 7.3},
-            "ATL": {"offensive": 110, "strikeout_rate": 23.1, "walk_rate": 8.7},
-            "NYM": {"offensive": 102, "strikeout_rate": 21.9, "walk_rate": 8.4},
-            "PHI": {"offensive": 106, "strikeout_rate": 22.7, "walk_rate": 8.9},
-            "WSH": {"offensive": 94, "strikeout_rate": 20.8, "walk_rate": 7.6},
-            "MIA": {"offensive": 90, "strikeout_rate": 25.3, "walk_rate": 7.1},
-            "CHC": {"offensive": 98, "strikeout_rate": 24.1, "walk_rate": 8.3},
-            "CIN": {"offensive": 101, "strikeout_rate": 23.5, "walk_rate": 8.5},
-            "MIL": {"offensive": 100, "strikeout_rate": 23.8, "walk_rate": 9.1},
-            "PIT": {"offensive": 92, "strikeout_rate": 24.2, "walk_rate": 7.5},
-            "STL": {"offensive": 102, "strikeout_rate": 19.8, "walk_rate": 8.7},
-            "HOU": {"offensive": 108, "strikeout_rate": 19.5, "walk_rate": 9.3},
-            "TEX": {"offensive": 105, "strikeout_rate": 23.1, "walk_rate": 8.2},
-            "LAA": {"offensive": 100, "strikeout_rate": 24.7, "walk_rate": 7.9},
-            "OAK": {"offensive": 88, "strikeout_rate": 24.9, "walk_rate": 7.3},
-            "SEA": {"offensive": 97, "strikeout_rate": 25.6, "walk_rate": 8.8},
-            "CLE": {"offensive": 99, "strikeout_rate": 21.2, "walk_rate": 7.9},
-            "DET": {"offensive": 93, "strikeout_rate": 23.8, "walk_rate": 7.3},
-            "KC": {"offensive": 95, "strikeout_rate": 22.1, "walk_rate": 7.1},
-            "MIN": {"offensive": 102, "strikeout_rate": 22.9, "walk_rate": 8.7},
-            "CWS": {"offensive": 97, "strikeout_rate": 23.5, "walk_rate": 7.6}
-        }
+        return {team: dict(ratings) for team, ratings in _TEAM_RATINGS.items()}
+    
+    def get_ballpark_factors_df(self) -> pd.Series:
+        """
+        Get ballpark factors as a float32 Series indexed by park name.
+        
+        Suited for vectorized lookups (``Series.map``/``DataFrame.join``)
+        against game or player frames.
+        
+        Returns:
+            pd.Series: Ballpark factors named 'park_factor'
+        """
+        return _ballpark_factors_series().copy()
+    
+    def get_team_ratings_df(self) -> pd.DataFrame:
+        """
+        Get offensive/defensive team ratings as a float32 DataFrame.
+        
+        Returns:
+            pd.DataFrame: Ratings indexed by team abbreviation with
+                'offensive', 'strikeout_rate' and 'walk_rate' columns
+        """
+        return _team_ratings_frame().copy()
     
     def get_probable_starters_for_next_week(self) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -305,10 +381,11 @@ class MLBStatsClient:
         starters_by_team = {}
         
         # Get schedule for next 7 days
-        today = datetime.now()
+        today = date_type.today()
         
         for day_offset in range(7):
             date = today + timedelta(days=day_offset)
+            date_str = date.isoformat()
             probables = self.get_probable_pitchers(date)
             
             for game_id, game_data in probables.items():
@@ -326,7 +403,7 @@ class MLBStatsClient:
                         starters_by_team[home_abbrev].append({
                             'name': home_pitcher.get('fullName', 'Unknown'),
                             'id': home_pitcher.get('id', 0),
-                            'date': date.strftime('%Y-%m-%d'),
+                            'date': date_str,
                             'opponent': game_data['away_team'],
                             'opponent_abbrev': self._get_team_abbreviation(game_data['away_team']),
                             'home_game': True
@@ -346,7 +423,7 @@ class MLBStatsClient:
                         starters_by_team[away_abbrev].append({
                             'name': away_pitcher.get('fullName', 'Unknown'),
                             'id': away_pitcher.get('id', 0),
-                            'date': date.strftime('%Y-%m-%d'),
+                            'date': date_str,
                             'opponent': game_data['home_team'],
                             'opponent_abbrev': self._get_team_abbreviation(game_data['home_team']),
                             'home_game': False
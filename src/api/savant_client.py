@@ -7,33 +7,241 @@ and more that are critical for identifying player trends and breakout candidates
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 import numpy as np
 import logging
 import time
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+import csv
 import io
 import re
 from bs4 import BeautifulSoup
 
+# PyArrow's multithreaded CSV reader is used when available
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Polars offers a faster opt-out CSV parser for wide leaderboard files; its
+# DataFrame.to_pandas conversion goes through PyArrow
+try:
+    import polars as pl
+    HAS_POLARS = HAS_PYARROW
+except ImportError:
+    HAS_POLARS = False
+
+# diskcache enables a persistent, size-bounded response cache when available
+try:
+    import diskcache
+    HAS_DISKCACHE = True
+except ImportError:
+    HAS_DISKCACHE = False
+
 logger = logging.getLogger(__name__)
 
+
+# Columns read from statcast_search CSVs by _calculate_player_metrics; Savant
+# returns ~90 columns per pitch, so everything else is skipped at parse time
+_BATTER_COLS = ['events', 'description', 'bb_type', 'launch_speed', 'launch_angle', 'barrel']
+_BATTER_DTYPES = {
+    'events': 'category',
+    'description': 'category',
+    'bb_type': 'category',
+    'launch_speed': 'float64',
+    'launch_angle': 'float64',
+    'barrel': 'float64',
+}
+_PITCHER_COLS = ['events', 'description', 'pitch_type', 'release_speed', 'release_spin_rate', 'zone']
+_PITCHER_DTYPES = {
+    'events': 'category',
+    'description': 'category',
+    'pitch_type': 'category',
+    'release_speed': 'float64',
+    'release_spin_rate': 'float64',
+    'zone': 'float64',
+}
+
+# Pitch/plate appearance outcome categories used by the metric calculations
+_SWING_DESCRIPTIONS = frozenset({'hit_into_play', 'swinging_strike', 'foul'})
+_TAKE_DESCRIPTIONS = frozenset({'ball', 'called_strike'})
+_HIT_EVENTS = frozenset({'single', 'double', 'triple', 'home_run'})
+_OUT_EVENTS = frozenset({'field_out', 'strikeout', 'double_play', 'fielders_choice_out', 'fielders_choice'})
+_WALK_EVENTS = frozenset({'walk', 'intent_walk'})
+
+
+def _csv_header(content: bytes) -> List[str]:
+    """
+    Get the column names from the first line of raw CSV bytes.
+    
+    Args:
+        content: Raw CSV response body
+        
+    Returns:
+        List: Column names
+    """
+    end = content.find(b'\n')
+    first_line = content if end == -1 else content[:end]
+    return next(csv.reader([first_line.decode('utf-8-sig').rstrip('\r')]), [])
+
+
+def _read_csv(content: bytes, 
+              usecols: Optional[List[str]] = None,
+              dtype: Optional[Dict[str, str]] = None,
+              use_polars: bool = False) -> pd.DataFrame:
+    """
+    Parse raw CSV bytes from Baseball Savant into a DataFrame.
+    
+    Args:
+        content: Raw CSV response body
+        usecols: Columns to parse; names missing from the file are ignored so
+            Savant schema changes degrade gracefully (default: all columns)
+        dtype: pandas dtype per column ('category' or a numeric dtype)
+        use_polars: Parse with Polars when it is installed
+        
+    Returns:
+        DataFrame: Parsed CSV data
+    """
+    if usecols is not None:
+        header = set(_csv_header(content))
+        usecols = [col for col in usecols if col in header]
+    dtype = {col: col_type for col, col_type in (dtype or {}).items()
+             if usecols is None or col in usecols}
+    
+    if use_polars and HAS_POLARS:
+        # Infer types from every row; Savant columns can start out all-integer
+        df = pl.read_csv(content, columns=usecols, infer_schema_length=None,
+                         try_parse_dates=False).to_pandas()
+        return df.astype(dtype) if dtype else df
+    
+    if HAS_PYARROW:
+        column_types = {
+            col: pa.dictionary(pa.int32(), pa.string()) if col_type == 'category'
+            else pa.from_numpy_dtype(np.dtype(col_type))
+            for col, col_type in dtype.items()
+        }
+        # Treat empty string cells as missing, matching pandas.read_csv
+        convert_options = pacsv.ConvertOptions(
+            strings_can_be_null=True,
+            column_types=column_types,
+            include_columns=usecols
+        )
+        table = pacsv.read_csv(
+            pa.py_buffer(content),
+            read_options=pacsv.ReadOptions(use_threads=True),
+            convert_options=convert_options
+        )
+        return table.to_pandas()
+    
+    return pd.read_csv(io.BytesIO(content), usecols=usecols, dtype=dtype or None)
+
+
 class BaseballSavantClient:
     """Client for retrieving data from Baseball Savant (Statcast)."""
     
     SAVANT_BASE_URL = "https://baseballsavant.mlb.com"
+    REQUEST_TIMEOUT = (5, 30)  # (connect, read) seconds
+    DISK_CACHE_SIZE_LIMIT = 2 << 30  # 2 GiB
+    PARSED_CACHE_SIZE = 32  # parsed DataFrames kept in memory
+    MAX_FETCH_WORKERS = 16
     
-    def __init__(self, cache_duration: int = 3600):
+    # statcast_search filters shared by every per-player request; only the
+    # season, player, and date range vary between calls
+    _STATCAST_SEARCH_BASE = {
+        "hfPT": "",
+        "hfAB": "",
+        "hfGT": "",
+        "hfPR": "",
+        "hfZ": "",
+        "hfStadium": "",
+        "hfBBL": "",
+        "hfNewZones": "",
+        "hfPull": "",
+        "hfC": "",
+        "hfSit": "",
+        "hfOuts": "",
+        "hfOpponent": "",
+        "pitcher_throws": "",
+        "batter_stands": "",
+        "hfSA": "",
+        "min_pitches": "0",
+        "min_results": "0",
+        "group_by": "name",
+        "sort_col": "pitches",
+        "player_event_sort": "h_launch_speed",
+        "sort_order": "desc",
+        "min_abs": "0",
+        "type": "details",
+    }
+    
+    def __init__(self, cache_duration: int = 3600, cache_dir: Optional[str] = None,
+                 fast_io: bool = True):
         """
         Initialize the Baseball Savant client.
         
         Args:
             cache_duration: Cache duration in seconds (default: 1 hour)
+            cache_dir: Directory for a persistent response cache shared across
+                runs (e.g. settings.CACHE_DIR). Requires diskcache; responses are
+                cached in memory when omitted or unavailable.
+            fast_io: Parse leaderboard CSVs with Polars when it is installed
         """
-        self.cache = {}
         self.cache_duration = cache_duration
+        self.fast_io = fast_io
+        self._disk_cache = False
         
+        if cache_dir and HAS_DISKCACHE:
+            self.cache = diskcache.Cache(cache_dir, size_limit=self.DISK_CACHE_SIZE_LIMIT)
+            self._disk_cache = True
+        else:
+            if cache_dir:
+                logger.warning("diskcache is not installed; using an in-memory Savant cache")
+            self.cache = {}
+        self._cache_lock = threading.Lock()
+        
+        # Parsed DataFrames keyed like self.cache, least recently used first and
+        # capped at PARSED_CACHE_SIZE; once a response is parsed the (much
+        # larger) raw CSV bytes no longer need to be held in memory
+        self.parsed_cache = OrderedDict()
+        
+        # Player name -> MLB ID mapping, refreshed every cache_duration seconds
+        self._id_mapping = None
+        self._id_mapping_time = 0.0
+        
+        # Reuse one keep-alive connection pool for every request to Savant
+        self.session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "User-Agent": "Fantasy Baseball Analyzer/1.0",
+            "Accept": "text/html,application/xhtml+xml,application/xml",
+            "Accept-Language": "en-US,en;q=0.9",
+        })
+        
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> tuple:
+        """
+        Build an order-independent cache key for a request.
+        
+        Args:
+            url: URL to request
+            params: Request parameters
+            
+        Returns:
+            tuple: Hashable cache key
+        """
+        return (url, None if params is None else tuple(sorted(params.items())))
+    
     def _get_cached_or_request(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """
         Get data from cache or make a new request if needed.
@@ -46,32 +254,89 @@ class BaseballSavantClient:
             Response content
         """
         # Check cache first
-        cache_key = f"{url}:{str(params)}"
-        if cache_key in self.cache:
-            cache_time, cache_data = self.cache[cache_key]
-            if time.time() - cache_time < self.cache_duration:
+        cache_key = self._cache_key(url, params)
+        if self._disk_cache:
+            # Keep on-disk keys short and fixed-length
+            cache_key = hashlib.blake2b(repr(cache_key).encode()).hexdigest()
+        now = time.time()
+        with self._cache_lock:
+            cached = self.cache.get(cache_key)
+        if cached is not None:
+            cache_time, cache_data = cached
+            if now - cache_time < self.cache_duration:
                 logger.debug(f"Using cached data for {url}")
                 return cache_data
         
         # Make the request
         try:
-            headers = {
-                "User-Agent": "Fantasy Baseball Analyzer/1.0",
-                "Accept": "text/html,application/xhtml+xml,application/xml",
-                "Accept-Language": "en-US,en;q=0.9",
-            }
-            
-            response = requests.get(url, params=params, headers=headers)
+            response = self.session.get(url, params=params, timeout=self.REQUEST_TIMEOUT)
             response.raise_for_status()
             
             # Cache the response
-            self.cache[cache_key] = (time.time(), response.content)
+            with self._cache_lock:
+                if self._disk_cache:
+                    self.cache.set(cache_key, (now, response.content),
+                                   expire=self.cache_duration)
+                else:
+                    self.cache[cache_key] = (now, response.content)
             
             return response.content
         except requests.exceptions.RequestException as e:
             logger.error(f"Error making request to Baseball Savant: {e}")
             return None
     
+    def _get_parsed_or_request(self, url: str, params: Optional[Dict[str, Any]] = None,
+                               usecols: Optional[List[str]] = None,
+                               dtype: Optional[Dict[str, str]] = None,
+                               use_polars: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Get a parsed CSV response from cache or request and parse it.
+        
+        Parsed frames are cached per request; a given URL and params are always
+        parsed with the same columns, so they are not part of the key.
+        
+        Args:
+            url: URL to request
+            params: Request parameters
+            usecols: Columns to parse (default: all columns)
+            dtype: pandas dtype per column
+            use_polars: Parse with Polars when it is installed
+            
+        Returns:
+            DataFrame: Parsed CSV data, or None if the request failed. Cached
+                frames are shared, so callers must not modify them in place.
+        """
+        cache_key = self._cache_key(url, params)
+        with self._cache_lock:
+            cached = self.parsed_cache.get(cache_key)
+            if cached is not None:
+                if time.time() - cached[0] < self.cache_duration:
+                    self.parsed_cache.move_to_end(cache_key)
+                else:
+                    # Expired; drop it now rather than holding it until refetched
+                    del self.parsed_cache[cache_key]
+                    cached = None
+        if cached is not None:
+            logger.debug(f"Using cached parsed data for {url}")
+            return cached[1]
+        
+        content = self._get_cached_or_request(url, params)
+        if content is None:
+            return None
+        
+        df = _read_csv(content, usecols=usecols, dtype=dtype, use_polars=use_polars)
+        
+        with self._cache_lock:
+            self.parsed_cache[cache_key] = (time.time(), df)
+            self.parsed_cache.move_to_end(cache_key)
+            while len(self.parsed_cache) > self.PARSED_CACHE_SIZE:
+                self.parsed_cache.popitem(last=False)
+            # The disk cache keeps raw bytes so they persist across runs
+            if not self._disk_cache:
+                self.cache.pop(cache_key, None)
+        
+        return df
+    
     def get_statcast_leaderboard(self, 
                                player_type: str = "batter", 
                                year: Optional[int] = None,
@@ -127,21 +392,61 @@ class BaseballSavantClient:
         # Clean up params - remove None values
         params = {k: v for k, v in params.items() if v is not None}
             
-        # Request the CSV data
+        # Request and parse the CSV data
         params["csv"] = "true"
-        content = self._get_cached_or_request(url, params)
-        
-        if content is None:
-            logger.error(f"Failed to retrieve data from {url}")
-            return pd.DataFrame()
-        
-        # Parse the CSV data
         try:
-            df = pd.read_csv(io.StringIO(content.decode('utf-8')))
-            return df
+            df = self._get_parsed_or_request(url, params, use_polars=self.fast_io)
         except Exception as e:
             logger.error(f"Error parsing CSV data: {e}")
             return pd.DataFrame()
+        
+        if df is None:
+            logger.error(f"Failed to retrieve data from {url}")
+            return pd.DataFrame()
+        
+        # Return a copy; callers add derived columns to the leaderboard
+        return df.copy()
+    
+    def _build_period_tasks(self, player_id: int, player_type: str) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Build the Statcast search requests for a player's trend periods.
+        
+        Args:
+            player_id: MLB player ID
+            player_type: 'batter' or 'pitcher'
+            
+        Returns:
+            List: (period name, URL, params) for each trend period
+        """
+        today = datetime.now().date()
+        end_str = today.isoformat()
+        season_str = f"{today.year}|"
+        
+        # Define time periods for trend analysis (API-formatted start dates)
+        period_starts = {
+            "last7": (today - timedelta(days=7)).isoformat(),
+            "last15": (today - timedelta(days=15)).isoformat(),
+            "last30": (today - timedelta(days=30)).isoformat(),
+            "season": f"{today.year}-03-01"  # Approximate season start
+        }
+        
+        url = f"{self.SAVANT_BASE_URL}/statcast_search"
+        
+        tasks = []
+        for period_name, start_str in period_starts.items():
+            # Build the search for the specific player and time period
+            params = {
+                **self._STATCAST_SEARCH_BASE,
+                "hfSea": season_str,
+                "player_type": player_type,
+                "player_id": player_id,
+                "game_date_gt": start_str,
+                "game_date_lt": end_str,
+                "csv": "true"  # Request the CSV data
+            }
+            tasks.append((period_name, url, params))
+        
+        return tasks
     
     def get_statcast_player_trends(self, 
                                  player_id: int, 
@@ -158,118 +463,75 @@ class BaseballSavantClient:
         Returns:
             Dict: Player trend data with metrics for different time periods
         """
-        # Get data for different time periods for trending analysis
-        end_date = datetime.now()
-        
-        # Define time periods for trend analysis
-        periods = {
-            "last7": (end_date - timedelta(days=7), end_date),
-            "last15": (end_date - timedelta(days=15), end_date),
-            "last30": (end_date - timedelta(days=30), end_date),
-            "season": (datetime(end_date.year, 3, 1), end_date)  # Approximate season start
-        }
+        return self.get_statcast_player_trends_batch([player_id], player_type, days_back)[player_id]
+    
+    def get_statcast_player_trends_batch(self, 
+                                       player_ids: List[int], 
+                                       player_type: str = "batter",
+                                       days_back: int = 30) -> Dict[int, Dict[str, Any]]:
+        """
+        Get Statcast trend data for many players at once.
         
-        trends = {}
+        All period requests for all players share one thread pool, so network
+        latency overlaps across players instead of adding up.
         
-        for period_name, (start_date, period_end_date) in periods.items():
-            # Format dates for the API
-            start_str = start_date.strftime('%Y-%m-%d')
-            end_str = period_end_date.strftime('%Y-%m-%d')
+        Args:
+            player_ids: MLB player IDs
+            player_type: 'batter' or 'pitcher'
+            days_back: How many days back to analyze
             
-            # Build URL for the specific player and time period
-            if player_type == "batter":
-                url = f"{self.SAVANT_BASE_URL}/statcast_search"
-                params = {
-                    "hfPT": "",
-                    "hfAB": "",
-                    "hfGT": "",
-                    "hfPR": "",
-                    "hfZ": "",
-                    "hfStadium": "",
-                    "hfBBL": "",
-                    "hfNewZones": "",
-                    "hfPull": "",
-                    "hfC": "",
-                    "hfSea": f"{end_date.year}|",
-                    "hfSit": "",
-                    "player_type": "batter",
-                    "hfOuts": "",
-                    "hfOpponent": "",
-                    "pitcher_throws": "",
-                    "batter_stands": "",
-                    "hfSA": "",
-                    "player_id": player_id,
-                    "min_pitches": "0",
-                    "min_results": "0",
-                    "group_by": "name",
-                    "sort_col": "pitches",
-                    "player_event_sort": "h_launch_speed",
-                    "sort_order": "desc",
-                    "min_abs": "0",
-                    "type": "details",
-                    "game_date_gt": start_str,
-                    "game_date_lt": end_str
-                }
-            else:  # pitcher
-                url = f"{self.SAVANT_BASE_URL}/statcast_search"
-                params = {
-                    "hfPT": "",
-                    "hfAB": "",
-                    "hfGT": "",
-                    "hfPR": "",
-                    "hfZ": "",
-                    "hfStadium": "",
-                    "hfBBL": "",
-                    "hfNewZones": "",
-                    "hfPull": "",
-                    "hfC": "",
-                    "hfSea": f"{end_date.year}|",
-                    "hfSit": "",
-                    "player_type": "pitcher",
-                    "hfOuts": "",
-                    "hfOpponent": "",
-                    "pitcher_throws": "",
-                    "batter_stands": "",
-                    "hfSA": "",
-                    "player_id": player_id,
-                    "min_pitches": "0",
-                    "min_results": "0",
-                    "group_by": "name",
-                    "sort_col": "pitches",
-                    "player_event_sort": "h_launch_speed",
-                    "sort_order": "desc",
-                    "min_abs": "0",
-                    "type": "details",
-                    "game_date_gt": start_str,
-                    "game_date_lt": end_str
-                }
-            
-            # Request the CSV data
-            params["csv"] = "true"
-            content = self._get_cached_or_request(url, params)
-            
-            if content is None:
-                logger.warning(f"Failed to retrieve {period_name} data for player {player_id}")
-                continue
-                
-            # Parse the CSV data
+        Returns:
+            Dict: Player trend data (see get_statcast_player_trends) by player ID
+        """
+        player_ids = list(dict.fromkeys(player_ids))
+        if not player_ids:
+            return {}
+        
+        tasks = [
+            (player_id, period_name, url, params)
+            for player_id in player_ids
+            for period_name, url, params in self._build_period_tasks(player_id, player_type)
+        ]
+        
+        # Only parse the columns the metric calculations use
+        if player_type == "batter":
+            usecols, dtypes = _BATTER_COLS, _BATTER_DTYPES
+        else:
+            usecols, dtypes = _PITCHER_COLS, _PITCHER_DTYPES
+        
+        # The period requests are independent, so fetch and parse them concurrently
+        with ThreadPoolExecutor(max_workers=min(self.MAX_FETCH_WORKERS, len(tasks))) as executor:
+            futures = [
+                (player_id, period_name,
+                 executor.submit(self._get_parsed_or_request, url, params, usecols, dtypes))
+                for player_id, period_name, url, params in tasks
+            ]
+        
+        trends = {player_id: {} for player_id in player_ids}
+        
+        for player_id, period_name, future in futures:
             try:
-                df = pd.read_csv(io.StringIO(content.decode('utf-8')))
+                df = future.result()
+                
+                if df is None:
+                    logger.warning(f"Failed to retrieve {period_name} data for player {player_id}")
+                    continue
                 
                 # Calculate period metrics
                 metrics = self._calculate_player_metrics(df, player_type)
-                trends[period_name] = metrics
+                trends[player_id][period_name] = metrics
             except Exception as e:
                 logger.error(f"Error parsing {period_name} data for player {player_id}: {e}")
-                trends[period_name] = {}
+                trends[player_id][period_name] = {}
         
         # Calculate trend indicators by comparing periods
-        trend_indicators = self._calculate_trend_indicators(trends)
-        
         return {
-            "player_id": player_id,
-            "metrics": trends,
-            "trend_indicators": trend_indicators
+            player_id: {
+                "player_id": player_id,
+                "metrics": player_trends,
+                "trend_indicators": self._calculate_trend_indicators(player_trends)
+            }
+            for player_id, player_trends in trends.items()
         }
     
     def _calculate_player_metrics(self, df: pd.DataFrame, player_type: str) -> Dict[str, Any]:
@@ -290,29 +552,29 @@ class BaseballSavantClient:
             return metrics
         
         # Common metrics for both batters and pitchers
-        events = df['events'].dropna().tolist() if 'events' in df.columns else []
         metrics['sample_size'] = len(df)
         
         if player_type == "batter":
             # Batter-specific metrics
             if 'launch_speed' in df.columns:
-                metrics['avg_exit_velo'] = df['launch_speed'].dropna().mean()
+                metrics['avg_exit_velo'] = df['launch_speed'].mean()
             
             if 'launch_angle' in df.columns:
-                metrics['avg_launch_angle'] = df['launch_angle'].dropna().mean()
+                metrics['avg_launch_angle'] = df['launch_angle'].mean()
             
             # Calculate barrel rate if enough data
             if 'barrel' in df.columns and len(df) > 0:
-                barrels = df['barrel'].fillna(0).sum()
+                barrels = df['barrel'].sum()
                 metrics['barrel_count'] = barrels
                 metrics['barrel_rate'] = (barrels / len(df)) * 100
             
             # Batted ball distribution
             if 'bb_type' in df.columns:
-                gb = df[df['bb_type'] == 'ground_ball'].shape[0]
-                fb = df[df['bb_type'] == 'fly_ball'].shape[0]
-                ld = df[df['bb_type'] == 'line_drive'].shape[0]
-                pu = df[df['bb_type'] == 'popup'].shape[0]
+                bb_counts = df['bb_type'].value_counts().to_dict()
+                gb = bb_counts.get('ground_ball', 0)
+                fb = bb_counts.get('fly_ball', 0)
+                ld = bb_counts.get('line_drive', 0)
+                pu = bb_counts.get('popup', 0)
                 
                 total_batted = gb + fb + ld + pu
                 if total_batted > 0:
@@ -323,9 +585,10 @@ class BaseballSavantClient:
             
             # Plate discipline
             if 'description' in df.columns:
-                swings = df[df['description'].isin(['hit_into_play', 'swinging_strike', 'foul'])].shape[0]
-                takes = df[df['description'].isin(['ball', 'called_strike'])].shape[0]
-                whiffs = df[df['description'] == 'swinging_strike'].shape[0]
+                desc_counts = df['description'].value_counts().to_dict()
+                swings = sum(desc_counts.get(d, 0) for d in _SWING_DESCRIPTIONS)
+                takes = sum(desc_counts.get(d, 0) for d in _TAKE_DESCRIPTIONS)
+                whiffs = desc_counts.get('swinging_strike', 0)
                 
                 if swings + takes > 0:
                     metrics['swing_pct'] = swings / (swings + takes) * 100
@@ -335,8 +598,9 @@ class BaseballSavantClient:
             
             # Outcome metrics
             if 'events' in df.columns:
-                hits = df[df['events'].isin(['single', 'double', 'triple', 'home_run'])].shape[0]
-                at_bats = len([e for e in events if e in ['single', 'double', 'triple', 'home_run', 'field_out', 'strikeout', 'double_play', 'fielders_choice_out', 'fielders_choice']])
+                event_counts = df['events'].value_counts().to_dict()
+                hits = sum(event_counts.get(e, 0) for e in _HIT_EVENTS)
+                at_bats = hits + sum(event_counts.get(e, 0) for e in _OUT_EVENTS)
                 
                 if at_bats > 0:
                     metrics['batting_avg'] = hits / at_bats
@@ -344,10 +608,10 @@ class BaseballSavantClient:
         elif player_type == "pitcher":
             # Pitcher-specific metrics
             if 'release_speed' in df.columns:
-                metrics['avg_velo'] = df['release_speed'].dropna().mean()
+                metrics['avg_velo'] = df['release_speed'].mean()
             
             if 'release_spin_rate' in df.columns:
-                metrics['avg_spin_rate'] = df['release_spin_rate'].dropna().mean()
+                metrics['avg_spin_rate'] = df['release_spin_rate'].mean()
             
             # Pitch mix
             if 'pitch_type' in df.columns:
@@ -359,9 +623,10 @@ class BaseballSavantClient:
             
             # Plate discipline metrics
             if 'description' in df.columns:
-                swings = df[df['description'].isin(['hit_into_play', 'swinging_strike', 'foul'])].shape[0]
-                takes = df[df['description'].isin(['ball', 'called_strike'])].shape[0]
-                whiffs = df[df['description'] == 'swinging_strike'].shape[0]
+                desc_counts = df['description'].value_counts().to_dict()
+                swings = sum(desc_counts.get(d, 0) for d in _SWING_DESCRIPTIONS)
+                takes = sum(desc_counts.get(d, 0) for d in _TAKE_DESCRIPTIONS)
+                whiffs = desc_counts.get('swinging_strike', 0)
                 
                 if swings + takes > 0:
                     metrics['swing_pct'] = swings / (swings + takes) * 100
@@ -379,10 +644,12 @@ class BaseballSavantClient:
             
             # Outcome metrics
             if 'events' in df.columns:
-                strikeouts = df[df['events'] == 'strikeout'].shape[0]
-                walks = df[df['events'].isin(['walk', 'intent_walk'])].shape[0]
+                event_counts = df['events'].value_counts().to_dict()
+                strikeouts = event_counts.get('strikeout', 0)
+                walks = sum(event_counts.get(e, 0) for e in _WALK_EVENTS)
                 
-                batters_faced = len(events)
+                # Every non-null event ends a plate appearance
+                batters_faced = sum(event_counts.values())
                 if batters_faced > 0:
                     metrics['k_pct'] = strikeouts / batters_faced * 100
                     metrics['bb_pct'] = walks / batters_faced * 100
@@ -409,15 +676,18 @@ class BaseballSavantClient:
         batter_metrics = ['avg_exit_velo', 'barrel_rate', 'ld_pct', 'whiff_pct', 'batting_avg']
         pitcher_metrics = ['avg_velo', 'whiff_pct', 'zone_pct', 'k_pct', 'bb_pct']
         
+        last7_metrics = period_metrics['last7']
+        last30_metrics = period_metrics['last30']
+        
         # Determine if we're dealing with a batter or pitcher based on available metrics
-        is_batter = 'avg_exit_velo' in period_metrics.get('last30', {})
+        is_batter = 'avg_exit_velo' in last30_metrics
         metrics_to_check = batter_metrics if is_batter else pitcher_metrics
         
         # Compare last 7 days to last 30 days (recent trend)
         for metric in metrics_to_check:
-            if metric in period_metrics.get('last7', {}) and metric in period_metrics.get('last30', {}):
-                last7 = period_metrics['last7'].get(metric)
-                last30 = period_metrics['last30'].get(metric)
+            if metric in last7_metrics and metric in last30_metrics:
+                last7 = last7_metrics[metric]
+                last30 = last30_metrics[metric]
                 
                 if last7 is not None and last30 is not None and last30 != 0:
                     # Calculate percent change
@@ -445,12 +715,17 @@ class BaseballSavantClient:
                             # For velocity, we usually want consistency
                             indicators[f"{metric}_trend_positive"] = abs(pct_change) < 5
         
-        # Overall trend indicator
-        positive_trends = sum(1 for k, v in indicators.items() if k.endswith('_trend_positive') and v)
-        negative_trends = sum(1 for k, v in indicators.items() if k.endswith('_trend_positive') and not v)
-        significant_trends = sum(1 for k, v in indicators.items() if k.endswith('_trend_significant') and v)
-        
-        total_tracked = sum(1 for k in indicators if k.endswith('_trend_positive'))
+        # Overall trend indicator (tallied in a single pass)
+        positive_trends = negative_trends = significant_trends = total_tracked = 0
+        for k, v in indicators.items():
+            if k.endswith('_trend_positive'):
+                total_tracked += 1
+                if v:
+                    positive_trends += 1
+                else:
+                    negative_trends += 1
+            elif k.endswith('_trend_significant') and v:
+                significant_trends += 1
         
         if total_tracked > 0:
             indicators['overall_trend_score'] = (positive_trends - negative_trends) / total_tracked
@@ -477,6 +752,9 @@ class BaseballSavantClient:
         Returns:
             Dict: Mapping of player names to MLB IDs
         """
+        if self._id_mapping and time.time() - self._id_mapping_time < self.cache_duration:
+            return self._id_mapping
+        
         # This is a simplified implementation - in reality, you would want to use
         # a more comprehensive source for player IDs
         
@@ -488,14 +766,16 @@ class BaseballSavantClient:
         
         # Process batters
         if not batters_df.empty and 'player_id' in batters_df.columns and 'player_name' in batters_df.columns:
-            batters_mapping = dict(zip(batters_df['player_name'], batters_df['player_id']))
+            batters_mapping = dict(zip(batters_df['player_name'].tolist(), batters_df['player_id'].tolist()))
             mapping.update(batters_mapping)
         
         # Process pitchers
         if not pitchers_df.empty and 'player_id' in pitchers_df.columns and 'player_name' in pitchers_df.columns:
-            pitchers_mapping = dict(zip(pitchers_df['player_name'], pitchers_df['player_id']))
+            pitchers_mapping = dict(zip(pitchers_df['player_name'].tolist(), pitchers_df['player_id'].tolist()))
             mapping.update(pitchers_mapping)
         
+        self._id_mapping = mapping
+        self._id_mapping_time = time.time()
         return mapping
     
     def find_breakout_candidates(self, player_type: str = "batter", min_sample: int = 20) -> List[Dict[str, Any]]:
@@ -534,30 +814,34 @@ class BaseballSavantClient:
         if player_type == "batter":
             # Check if the necessary columns exist
             if all(col in df.columns for col in ['player_name', 'player_id', 'ba', 'xba', 'slg', 'xslg', 'woba', 'xwoba']):
-                # Calculate differences
-                df['ba_diff'] = df['xba'] - df['ba']
-                df['slg_diff'] = df['xslg'] - df['slg']
-                df['woba_diff'] = df['xwoba'] - df['woba']
-                
-                # Identify potential breakout candidates
-                candidates = df[
-                    (df['ba_diff'] > 0.020) |  # Expected BA at least 20 points higher
-                    (df['slg_diff'] > 0.050) |  # Expected SLG at least 50 points higher
-                    (df['woba_diff'] > 0.030)   # Expected wOBA at least 30 points higher
-                ]
+                # Calculate differences on the raw arrays; the columns share an index
+                ba_diff = df['xba'].to_numpy() - df['ba'].to_numpy()
+                slg_diff = df['xslg'].to_numpy() - df['slg'].to_numpy()
+                woba_diff = df['xwoba'].to_numpy() - df['woba'].to_numpy()
+                df['ba_diff'] = ba_diff
+                df['slg_diff'] = slg_diff
+                df['woba_diff'] = woba_diff
                 
-                # Calculate a composite "breakout score"
-                candidates['breakout_score'] = (
-                    (candidates['ba_diff'] / 0.020) + 
-                    (candidates['slg_diff'] / 0.050) + 
-                    (candidates['woba_diff'] / 0.030)
+                # Calculate a composite "breakout score" before filtering so the
+                # column is added once to df rather than to a filtered copy
+                df['breakout_score'] = (
+                    (ba_diff / 0.020) + 
+                    (slg_diff / 0.050) + 
+                    (woba_diff / 0.030)
                 ) / 3
                 
-                # Sort by breakout score
-                candidates = candidates.sort_values('breakout_score', ascending=False)
+                # Identify potential breakout candidates
+                candidates = df[np.logical_or.reduce([
+                    ba_diff > 0.020,   # Expected BA at least 20 points higher
+                    slg_diff > 0.050,  # Expected SLG at least 50 points higher
+                    woba_diff > 0.030  # Expected wOBA at least 30 points higher
+                ])]
+                
+                # Keep the top 20 by breakout score (partial selection, no full sort)
+                top = candidates.nlargest(20, 'breakout_score')
                 
                 # Convert to list of dictionaries
-                for _, row in candidates.head(20).iterrows():
+                for row in top.to_dict('records'):
                     player_data = {
                         'player_id': row['player_id'],
                         'name': row['player_name'],
@@ -586,29 +870,29 @@ class BaseballSavantClient:
             # Check if the necessary columns exist
             if all(col in df.columns for col in ['player_name', 'player_id', 'era', 'xera', 'woba', 'xwoba']):
                 # Calculate differences (for pitchers, negative is better)
-                df['era_diff'] = df['xera'] - df['era']
-                df['woba_diff'] = df['xwoba'] - df['woba']
-                
-                # Identify potential breakout candidates
-                candidates = df[
-                    (df['era_diff'] < -0.50) |  # Expected ERA at least 0.50 lower
-                    (df['woba_diff'] < -0.020)  # Expected wOBA at least 20 points lower
-                ]
+                era_diff = df['xera'].to_numpy() - df['era'].to_numpy()
+                woba_diff = df['xwoba'].to_numpy() - df['woba'].to_numpy()
+                df['era_diff'] = era_diff
+                df['woba_diff'] = woba_diff
                 
                 # Calculate a composite "breakout score" (negative is better for pitchers)
-                candidates['breakout_score'] = (
-                    (candidates['era_diff'] / -0.50) + 
-                    (candidates['woba_diff'] / -0.020)
+                # Converted to positive for easier interpretation
+                df['breakout_score'] = np.abs(
+                    (era_diff / -0.50) + 
+                    (woba_diff / -0.020)
                 ) / 2
                 
-                # Convert to positive score for easier interpretation
-                candidates['breakout_score'] = candidates['breakout_score'].abs()
+                # Identify potential breakout candidates
+                candidates = df[np.logical_or.reduce([
+                    era_diff < -0.50,   # Expected ERA at least 0.50 lower
+                    woba_diff < -0.020  # Expected wOBA at least 20 points lower
+                ])]
                 
-                # Sort by breakout score
-                candidates = candidates.sort_values('breakout_score', ascending=False)
+                # Keep the top 20 by breakout score (partial selection, no full sort)
+                top = candidates.nlargest(20, 'breakout_score')
                 
                 # Convert to list of dictionaries
-                for _, row in candidates.head(20).iterrows():
+                for row in top.to_dict('records'):
                     player_data = {
                         'player_id': row['player_id'],
                         'name': row['player_name'],
@@ -631,12 +915,12 @@ class BaseballSavantClient:
         
         return breakout_candidates
     
-    def _generate_breakout_reason(self, player_row: pd.Series, player_type: str) -> str:
+    def _generate_breakout_reason(self, player_row: Dict[str, Any], player_type: str) -> str:
         """
         Generate a human-readable explanation for why a player is a breakout candidate.
         
         Args:
-            player_row: Row of player data
+            player_row: Row of player data as a column -> value mapping
             player_type: 'batter' or 'pitcher'
             
         Returns:
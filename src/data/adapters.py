@@ -11,6 +11,8 @@ class SimpleMatchup:
     This is especially useful at the beginning of the season or for future matchups.
     """
     
+    __slots__ = ('team_1', 'team_2', 'team_1_score', 'team_2_score', 'week')
+    
     def __init__(self, team1, team2, week=1):
         """
         Initialize a simplified matchup.
@@ -25,10 +27,39 @@ class SimpleMatchup:
         self.team_1_score = 0.0
         self.team_2_score = 0.0
         self.week = week
-        self.home_team = team1  # For compatibility with ESPN API structure
-        self.away_team = team2  # For compatibility with ESPN API structure
-        self.home_score = 0.0   # For compatibility with ESPN API structure
-        self.away_score = 0.0   # For compatibility with ESPN API structure
+    
+    # Aliases for compatibility with ESPN API structure
+    @property
+    def home_team(self):
+        return self.team_1
+    
+    @home_team.setter
+    def home_team(self, team):
+        self.team_1 = team
+    
+    @property
+    def away_team(self):
+        return self.team_2
+    
+    @away_team.setter
+    def away_team(self, team):
+        self.team_2 = team
+    
+    @property
+    def home_score(self):
+        return self.team_1_score
+    
+    @home_score.setter
+    def home_score(self, score):
+        self.team_1_score = score
+    
+    @property
+    def away_score(self):
+        return self.team_2_score
+    
+    @away_score.setter
+    def away_score(self, score):
+        self.team_2_score = score
         
     @classmethod
     def from_schedule_entry(cls, schedule_entry, my_team_id):
@@ -51,12 +82,18 @@ class SimpleMatchup:
             team1 = schedule_entry.home_team
             team2 = schedule_entry.away_team
         else:
-            # Try to find teams as attributes
-            for attr_name in dir(schedule_entry):
-                if attr_name.startswith('_'):
+            # Try to find teams as attributes, scanning the instance dict when
+            # there is one so methods and properties are never resolved
+            instance_attrs = getattr(schedule_entry, '__dict__', None)
+            if instance_attrs is not None:
+                attrs = instance_attrs.items()
+            else:
+                attrs = ((name, getattr(schedule_entry, name)) for name in dir(schedule_entry))
+            
+            for attr_name, attr_value in attrs:
+                if attr_name[0] == '_':
                     continue
                     
-                attr_value = getattr(schedule_entry, attr_name)
                 if hasattr(attr_value, 'team_id'):
                     if team1 is None:
                         team1 = attr_value
@@ -76,6 +113,8 @@ class SimplePlayer:
     A simplified player class that can be used when full ESPN API data is not available.
     """
     
+    __slots__ = ('name', 'proTeam', 'eligibleSlots', 'stats', 'playerId')
+    
     def __init__(self, name, team, position, projected_points=0.0):
         """
         Initialize a simplified player.
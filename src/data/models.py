@@ -1,9 +1,51 @@
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import datetime
+import operator
+import sys
 
+import numpy as np
 
-@dataclass
+# Slotted dataclasses drop the per-instance __dict__; the option needs Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# ESPN attributes read by the from_espn constructors, fetched in one attrgetter
+# call. Defaults are used only when an attribute is missing; callables (list,
+# dict) are invoked so every instance gets its own container.
+_PLAYER_FIELDS = ('playerId', 'name', 'proTeam', 'eligibleSlots', 'stats')
+_PLAYER_DEFAULTS = (0, 'Unknown', 'Unknown', list, dict)
+_PLAYER_GETTER = operator.attrgetter(*_PLAYER_FIELDS)
+
+_TEAM_FIELDS = ('standing', 'wins', 'losses', 'ties', 'division_id', 'division_name',
+                'logo_url', 'schedule', 'stats')
+_TEAM_DEFAULTS = (None, 0, 0, 0, None, None, None, None, None)
+_TEAM_GETTER = operator.attrgetter(*_TEAM_FIELDS)
+
+
+def _safe_attrs(obj, getter: operator.attrgetter, fields: Tuple[str, ...],
+                defaults: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """
+    Fetch several attributes at once, falling back to defaults for missing ones.
+    
+    Args:
+        obj: Object to read from
+        getter: attrgetter over fields
+        fields: Attribute names, in getter order
+        defaults: Default for each field
+        
+    Returns:
+        tuple: Attribute values in field order
+    """
+    try:
+        return getter(obj)
+    except AttributeError:
+        return tuple(
+            getattr(obj, name, default() if callable(default) else default)
+            for name, default in zip(fields, defaults)
+        )
+
+
+@dataclass(**_SLOTS)
 class Player:
     """Player data model."""
     
@@ -25,15 +67,18 @@ class Player:
             Player: New Player instance
         """
         # Convert ESPN player to our model
+        player_id, name, pro_team, eligible_slots, stats = _safe_attrs(
+            espn_player, _PLAYER_GETTER, _PLAYER_FIELDS, _PLAYER_DEFAULTS
+        )
         return cls(
-            playerId=getattr(espn_player, 'playerId', 0),
-            name=getattr(espn_player, 'name', 'Unknown'),
-            proTeam=getattr(espn_player, 'proTeam', 'Unknown'),
-            eligibleSlots=getattr(espn_player, 'eligibleSlots', []),
-            stats=getattr(espn_player, 'stats', {})
+            playerId=player_id,
+            name=name,
+            proTeam=pro_team,
+            eligibleSlots=eligible_slots,
+            stats=stats
         )
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Owner:
     """Team owner data model."""
     
@@ -52,7 +97,7 @@ class Owner:
             last_name=espn_owner.get('lastName', '')
         )
 
-@dataclass
+@dataclass(**_SLOTS)
 class Team:
     """Team data model."""
     
@@ -99,15 +144,9 @@ class Team:
             else:
                 owners.append(Owner(id='', display_name=str(espn_team.owners), first_name='', last_name=''))
         
-        # Get standing information
-        standing = getattr(espn_team, 'standing', None)
-        wins = getattr(espn_team, 'wins', 0)
-        losses = getattr(espn_team, 'losses', 0)
-        ties = getattr(espn_team, 'ties', 0)
-        
-        # Get division information
-        division_id = getattr(espn_team, 'division_id', None)
-        division_name = getattr(espn_team, 'division_name', None)
+        # Get standing, division and other optional information
+        (standing, wins, losses, ties, division_id, division_name,
+         logo_url, schedule, stats) = _safe_attrs(espn_team, _TEAM_GETTER, _TEAM_FIELDS, _TEAM_DEFAULTS)
             
         return cls(
             team_id=espn_team.team_id,
@@ -116,17 +155,17 @@ class Team:
             owners=owners,
             division_id=division_id,
             division_name=division_name,
-            logo_url=getattr(espn_team, 'logo_url', None),
+            logo_url=logo_url,
             standing=standing,
             wins=wins,
             losses=losses,
             ties=ties,
             roster=roster,
-            schedule=getattr(espn_team, 'schedule', None),
-            stats=getattr(espn_team, 'stats', None)
+            schedule=schedule,
+            stats=stats
         )
 
-@dataclass
+@dataclass(**_SLOTS)
 class Matchup:
     """Weekly matchup data model."""
     
@@ -167,8 +206,56 @@ class Matchup:
             team_2_score=espn_matchup.away_score,
             winner=winner
         )
+    
+    @classmethod
+    def from_espn_batch(cls, espn_matchups, week) -> List['Matchup']:
+        """
+        Create Matchup instances for a list of ESPN API matchup objects.
+        
+        Winners are decided for all matchups at once, and each ESPN team is
+        converted only once even when it appears in several matchups.
+        
+        Args:
+            espn_matchups: ESPN API matchup objects
+            week: Week number
+            
+        Returns:
+            List[Matchup]: New Matchup instances, in input order
+        """
+        espn_matchups = list(espn_matchups)
+        home_scores = np.fromiter((m.home_score for m in espn_matchups), dtype=np.float64,
+                                  count=len(espn_matchups))
+        away_scores = np.fromiter((m.away_score for m in espn_matchups), dtype=np.float64,
+                                  count=len(espn_matchups))
+        
+        # 0 = home team won, 1 = away team won, -1 = tie
+        winner_idx = np.where(home_scores > away_scores, 0,
+                              np.where(away_scores > home_scores, 1, -1)).tolist()
+        
+        teams = {}
+        
+        def convert(espn_team):
+            team = teams.get(espn_team.team_id)
+            if team is None:
+                team = teams[espn_team.team_id] = Team.from_espn(espn_team)
+            return team
+        
+        matchups = []
+        for espn_matchup, idx in zip(espn_matchups, winner_idx):
+            team_1 = convert(espn_matchup.home_team)
+            team_2 = convert(espn_matchup.away_team)
+            matchups.append(cls(
+                week=week,
+                team_1=team_1,
+                team_2=team_2,
+                team_1_score=espn_matchup.home_score,
+                team_2_score=espn_matchup.away_score,
+                winner=(team_1, team_2)[idx] if idx >= 0 else None
+            ))
+        
+        return matchups
 
-@dataclass
+@dataclass(**_SLOTS)
 class League:
     """League data model."""
     
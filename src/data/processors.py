@@ -1,12 +1,17 @@
 # src/data/processors.py
 import pandas as pd
+import numpy as np
 import logging
-from typing import List, Dict, Any
+from collections import namedtuple
+from typing import List, Dict, Any, Optional
 
 from src.data.models import Team, Player
 
 logger = logging.getLogger(__name__)
 
+# Row type for calculate_team_stats standings; use ._asdict() for dict form
+Standing = namedtuple('Standing', ['name', 'standing', 'wins', 'losses'])
+
 class TeamDataProcessor:
     """Process team data for analysis."""
 
@@ -21,71 +26,95 @@ class TeamDataProcessor:
         Returns:
             pd.DataFrame: DataFrame containing team data
         """
-        team_data = []
+        # Build column-wise lists in one pass; pandas takes typed columns directly
+        team_ids, names, abbreviations, owner_names = [], [], [], []
+        division_ids, division_names, standings = [], [], []
+        wins, losses, ties, roster_sizes, logo_urls = [], [], [], [], []
         for team in teams:
-            # First, let's examine what attributes are actually available
-            team_dict = {}
-            
-            # Handle the team name/ID
-            team_dict['team_id'] = getattr(team, 'team_id', None)
-            team_dict['name'] = getattr(team, 'team_name', None)  # Use team_name instead of name
-            team_dict['abbreviation'] = getattr(team, 'team_abbrev', None)
+            team_ids.append(getattr(team, 'team_id', None))
+            names.append(getattr(team, 'team_name', None))  # Use team_name instead of name
+            abbreviations.append(getattr(team, 'team_abbrev', None))
             
             # Handle owners - could be a dictionary or something else
             owners_info = getattr(team, 'owners', None)
             if owners_info:
                 if isinstance(owners_info, list) and isinstance(owners_info[0], dict):
-                    team_dict['owner_name'] = owners_info[0].get('displayName', 'Unknown')
+                    owner_names.append(owners_info[0].get('displayName', 'Unknown'))
                 else:
-                    team_dict['owner_name'] = str(owners_info)
+                    owner_names.append(str(owners_info))
             else:
-                team_dict['owner_name'] = 'Unknown'
+                owner_names.append('Unknown')
             
             # Other team attributes
-            team_dict['division_id'] = getattr(team, 'division_id', None)
-            team_dict['division_name'] = getattr(team, 'division_name', None)
-            team_dict['standing'] = getattr(team, 'standing', None)
-            team_dict['wins'] = getattr(team, 'wins', 0)
-            team_dict['losses'] = getattr(team, 'losses', 0)
-            team_dict['ties'] = getattr(team, 'ties', 0)
-            
-            # Calculate win percentage
-            total_games = team_dict['wins'] + team_dict['losses']
-            team_dict['win_percentage'] = (team_dict['wins'] / total_games * 100) if total_games > 0 else 0
+            division_ids.append(getattr(team, 'division_id', None))
+            division_names.append(getattr(team, 'division_name', None))
+            standings.append(getattr(team, 'standing', None))
+            wins.append(getattr(team, 'wins', 0))
+            losses.append(getattr(team, 'losses', 0))
+            ties.append(getattr(team, 'ties', 0))
             
             # Roster size
             roster = getattr(team, 'roster', None)
-            team_dict['roster_size'] = len(roster) if roster else 0
+            roster_sizes.append(len(roster) if roster else 0)
             
             # Logo URL
-            team_dict['logo_url'] = getattr(team, 'logo_url', None)
-            
-            team_data.append(team_dict)
+            logo_urls.append(getattr(team, 'logo_url', None))
         
-        return pd.DataFrame(team_data)
+        # Calculate win percentage for all teams at once
+        wins_arr = np.asarray(wins, dtype=np.float64)
+        total_games = wins_arr + np.asarray(losses, dtype=np.float64)
+        win_percentage = np.divide(wins_arr * 100, total_games,
+                                   out=np.zeros_like(wins_arr), where=total_games > 0)
+        
+        return pd.DataFrame({
+            'team_id': team_ids,
+            'name': names,
+            'abbreviation': abbreviations,
+            'owner_name': owner_names,
+            'division_id': division_ids,
+            'division_name': division_names,
+            'standing': standings,
+            'wins': wins,
+            'losses': losses,
+            'ties': ties,
+            'win_percentage': win_percentage,
+            'roster_size': roster_sizes,
+            'logo_url': logo_urls
+        })
     
     @staticmethod
-    def calculate_team_stats(teams: List[Team]) -> Dict[str, Any]:
+    def calculate_team_stats(teams: List[Team], df: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """
         Calculate various statistics for teams.
         
         Args:
             teams: List of Team objects
+            df: Optional DataFrame already built by teams_to_dataframe(teams);
+                pass it to avoid converting the teams a second time
             
         Returns:
             dict: Dictionary containing team statistics
         """
-        df = TeamDataProcessor.teams_to_dataframe(teams)
+        if df is None:
+            df = TeamDataProcessor.teams_to_dataframe(teams)
         
         stats = {
             'total_teams': len(teams),
             'avg_wins': df['wins'].mean(),
             'avg_losses': df['losses'].mean(),
             'max_wins': df['wins'].max(),
-            'min_wins': df['wins'].min(),
-            'standings': df.sort_values('standing')[['name', 'standing', 'wins', 'losses']].to_dict('records')
+            'min_wins': df['wins'].min()
         }
         
+        # Build standings rows straight from the column arrays
+        ordered = df.sort_values('standing', kind='stable')
+        stats['standings'] = list(map(Standing._make, zip(
+            ordered['name'].to_numpy().tolist(),
+            ordered['standing'].to_numpy().tolist(),
+            ordered['wins'].to_numpy().tolist(),
+            ordered['losses'].to_numpy().tolist()
+        )))
+        
         # Calculate division stats if available
         if df['division_id'].notna().any():
             division_stats = df.groupby('division_name').agg({
@@ -119,24 +148,33 @@ class PlayerDataProcessor:
                 'player_id': getattr(player, 'playerId', None),
                 'name': getattr(player, 'name', 'Unknown'),
                 'team': getattr(player, 'proTeam', getattr(player, 'team', 'Unknown')),
-                'positions': ', '.join(str(pos) for pos in getattr(player, 'eligibleSlots', [])) 
-                            if hasattr(player, 'eligibleSlots') else '',
+                'positions': ', '.join(map(str, getattr(player, 'eligibleSlots', None) or ())),
             }
             
-            # Add stats if available
+            # Add stats if available, keeping only simple values; json_normalize
+            # flattens the nested stat types into '<stat_type>_<stat_name>' columns
             stats = getattr(player, 'stats', None)
             if stats and isinstance(stats, dict):
                 for stat_type, stat_values in stats.items():
                     if isinstance(stat_values, dict):
-                        for stat_name, stat_value in stat_values.items():
-                            # Only add the stat if it's a simple value, not another dictionary
-                            if not isinstance(stat_value, dict) and not isinstance(stat_value, list):
-                                stat_key = f'{stat_type}_{stat_name}'
-                                player_dict[stat_key] = stat_value
-                    elif not isinstance(stat_values, dict) and not isinstance(stat_values, list):
+                        simple_values = {
+                            stat_name: stat_value
+                            for stat_name, stat_value in stat_values.items()
+                            if not isinstance(stat_value, (dict, list))
+                        }
+                        if simple_values:
+                            player_dict[stat_type] = simple_values
+                    elif not isinstance(stat_values, list):
                         # If stat_values is not a dictionary or list, add it directly
                         player_dict[stat_type] = stat_values
             
             player_data.append(player_dict)
         
-        return pd.DataFrame(player_data)
\ No newline at end of file
+        df = pd.json_normalize(player_data, sep='_')
+        
+        # Few distinct position strings exist, so store them as a categorical;
+        # .str filters then run once per distinct value instead of once per row
+        if 'positions' in df.columns:
+            df['positions'] = df['positions'].astype('category')
+        
+        return df
\ No newline at end of file
@@ -1,12 +1,30 @@
 # src/visualization/__init__.py
-from src.visualization.charts import TeamVisualizer
-from src.visualization.player_charts import PlayerVisualizer
-from src.visualization.category_charts import CategoryVisualizer
-from src.visualization.trend_charts import TrendVisualizer
+import importlib
+
+# Visualizers are imported on first access (PEP 562) so that importing a light
+# submodule such as delivery does not pull in matplotlib and seaborn
+_LAZY_IMPORTS = {
+    'TeamVisualizer': 'src.visualization.charts',
+    'PlayerVisualizer': 'src.visualization.player_charts',
+    'CategoryVisualizer': 'src.visualization.category_charts',
+    'TrendVisualizer': 'src.visualization.trend_charts'
+}
 
 __all__ = [
     'TeamVisualizer',
     'PlayerVisualizer',
     'CategoryVisualizer',
     'TrendVisualizer'
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
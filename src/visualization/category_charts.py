@@ -1,5 +1,10 @@
 # src/visualization/category_charts.py
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib import cm
+from matplotlib.axes import Axes
+from matplotlib.collections import PolyCollection
+from matplotlib.artist import setp
+from matplotlib.lines import Line2D
 import seaborn as sns
 import pandas as pd
 import numpy as np
@@ -8,10 +13,23 @@ import os
 
 from src.data.models import Team, Player
 from src.analysis.category_analysis import CategoryAnalyzer
+from src.visualization.figures import new_figure, save_png
 
 class CategoryVisualizer:
     """Visualize category analysis data."""
     
+    # Radar angles keyed by number of categories, shared across charts
+    _ANGLE_CACHE: Dict[int, np.ndarray] = {}
+    
+    # Strength reference circles drawn on every radar chart
+    _CIRCLE_THETA = np.linspace(0, 2*np.pi, 100)
+    _CIRCLE_VERTS = np.dstack(np.broadcast_arrays(_CIRCLE_THETA, np.array([[20], [40], [60], [80]])))
+    _CIRCLE_COLORS = [(0.9, 0.2, 0.2, 0.1), (0.9, 0.6, 0.2, 0.1), 
+                      (0.8, 0.8, 0.2, 0.1), (0.2, 0.7, 0.2, 0.1)]
+    
+    # Viridis lookup table (RGB), sampled per chart instead of building a seaborn palette
+    _VIRIDIS = cm.viridis(np.arange(cm.viridis.N))[:, :3]
+    
     def __init__(self, output_dir: str = 'output'):
         """
         Initialize the visualizer.
@@ -21,10 +39,27 @@ class CategoryVisualizer:
         """
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
+        # Output paths are built by concatenation against this prefix
+        self._output_prefix = os.path.join(output_dir, '')
         
         # Set up styling
         sns.set_style('whitegrid')
-        plt.rcParams['figure.figsize'] = (12, 8)
+        matplotlib.rcParams['figure.figsize'] = (12, 8)
+    
+    @classmethod
+    def _viridis_palette(cls, n_colors: int) -> List[Tuple[float, float, float]]:
+        """
+        Sample n evenly spaced viridis colors, matching sns.color_palette('viridis', n).
+        
+        Args:
+            n_colors: Number of colors
+            
+        Returns:
+            list: RGB tuples
+        """
+        bins = np.linspace(0, 1, n_colors + 2)[1:-1]
+        return cls._VIRIDIS[(bins * len(cls._VIRIDIS)).astype(int)].tolist()
+    
         
     def visualize_category_strengths(
         self, analysis: Dict[str, Any], category_type: str = "both", 
@@ -47,32 +82,33 @@ class CategoryVisualizer:
         # Generate radar charts for categorical analysis
         if category_type == "both":
             # Create a figure with two subplots
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(18, 8), subplot_kw=dict(polar=True))
+            fig = new_figure(figsize=(18, 8))
+            ax1, ax2 = fig.subplots(1, 2, subplot_kw=dict(polar=True))
             self._create_radar_chart(analysis, "batting", ax1)
             self._create_radar_chart(analysis, "pitching", ax2)
             
             fig.suptitle(f"Category Analysis for {analysis['team_name']}", fontsize=18)
         else:
             # Create a single radar chart
-            fig, ax = plt.subplots(figsize=(12, 10), subplot_kw=dict(polar=True))
+            fig = new_figure(figsize=(12, 10))
+            ax = fig.add_subplot(111, polar=True)
             self._create_radar_chart(analysis, category_type, ax)
             
             fig.suptitle(f"{category_type.capitalize()} Category Analysis for {analysis['team_name']}", fontsize=18)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Generate filename if not provided
         if filename is None:
             filename = f"category_analysis_{analysis['team_id']}.png"
         
         # Save the figure
-        output_path = os.path.join(self.output_dir, filename)
-        plt.savefig(output_path)
-        plt.close()
+        output_path = self._output_prefix + filename
+        save_png(fig, output_path)
         
         return output_path
     
-    def _create_radar_chart(self, analysis: Dict[str, Any], category_type: str, ax: plt.Axes) -> None:
+    def _create_radar_chart(self, analysis: Dict[str, Any], category_type: str, ax: Axes) -> None:
         """
         Create a radar chart on the given axes.
         
@@ -93,7 +129,11 @@ class CategoryVisualizer:
         
         # Calculate number of variables and angles
         N = len(cat_names)
-        angles = np.linspace(0, 2*np.pi, N, endpoint=False).tolist()
+        base_angles = self._ANGLE_CACHE.get(N)
+        if base_angles is None:
+            base_angles = np.linspace(0, 2*np.pi, N, endpoint=False)
+            self._ANGLE_CACHE[N] = base_angles
+        angles = base_angles.tolist()
         
         # Close the polygon
         percentiles += [percentiles[0]]
@@ -115,11 +155,8 @@ class CategoryVisualizer:
         ax.set_title(f"{category_type.capitalize()} Categories", fontsize=16)
         
         # Add strength reference circles
-        circle_colors = [(0.9, 0.2, 0.2, 0.1), (0.9, 0.6, 0.2, 0.1), 
-                        (0.8, 0.8, 0.2, 0.1), (0.2, 0.7, 0.2, 0.1)]
-        circles = [20, 40, 60, 80]
-        for r, color in zip(circles, circle_colors):
-            ax.fill(np.linspace(0, 2*np.pi, 100), [r]*100, color=color)
+        ax.add_collection(PolyCollection(self._CIRCLE_VERTS, facecolors=self._CIRCLE_COLORS,
+                                         edgecolors=self._CIRCLE_COLORS))
         
         # Add legend for strength levels
         strength_levels = ['Very Weak', 'Weak', 'Average', 'Strong', 'Very Strong']
@@ -128,7 +165,7 @@ class CategoryVisualizer:
         
         for i, (level, perc) in enumerate(zip(strength_levels, percentile_ranges)):
             color = (0.9 - i*0.2, 0.2 + i*0.15, 0.2, 0.5)
-            legend_elements.append(plt.Line2D([0], [0], marker='o', color='w', 
+            legend_elements.append(Line2D([0], [0], marker='o', color='w', 
                                    label=f'{level} ({perc})', 
                                    markerfacecolor=color, markersize=10))
         
@@ -172,32 +209,33 @@ class CategoryVisualizer:
         
         # For ERA, WHIP and other "lower is better" stats, we need to sort differently
         ascending = stat_category in ['ERA', 'WHIP', 'BB/9']
-        df = df.sort_values("value", ascending=ascending)
+        df = df.sort_values("value", ascending=ascending, kind="stable")
+        order = df["team_name"].tolist()
         
         # Create visualization
-        plt.figure(figsize=(12, 8))
-        bars = sns.barplot(x="team_name", y="value", data=df, palette="viridis")
-        
-        # Add percentiles as text on bars
-        for i, p in enumerate(bars.patches):
-            percentile = df.iloc[i]["percentile"]
-            bars.text(p.get_x() + p.get_width()/2., p.get_height() + 0.1,
-                     f'{percentile:.1f}%', ha="center", fontsize=10)
-        
-        plt.title(f"Team Rankings by {stat_category}", fontsize=16)
-        plt.xlabel("Team", fontsize=12)
-        plt.ylabel(stat_category, fontsize=12)
-        plt.xticks(rotation=45, ha="right")
-        plt.tight_layout()
+        fig = new_figure(figsize=(12, 8))
+        ax = fig.add_subplot(111)
+        sns.barplot(x="team_name", y="value", data=df, ax=ax, order=order,
+                    palette=self._viridis_palette(df["team_name"].nunique()))
+        
+        # Add percentiles as labels on bars; seaborn may put each bar in its own container
+        labels = iter([f'{p:.1f}%' for p in df["percentile"]])
+        for container in ax.containers:
+            ax.bar_label(container, labels=[next(labels) for _ in container], padding=3, fontsize=10)
+        
+        ax.set_title(f"Team Rankings by {stat_category}", fontsize=16)
+        ax.set_xlabel("Team", fontsize=12)
+        ax.set_ylabel(stat_category, fontsize=12)
+        setp(ax.get_xticklabels(), rotation=45, ha="right")
+        fig.tight_layout()
         
         # Generate filename if not provided
         if filename is None:
             filename = f"category_ranking_{stat_category}.png"
         
         # Save the figure
-        output_path = os.path.join(self.output_dir, filename)
-        plt.savefig(output_path)
-        plt.close()
+        output_path = self._output_prefix + filename
+        save_png(fig, output_path)
         
         return output_path
     
@@ -227,43 +265,43 @@ class CategoryVisualizer:
         player_recs = recommendations["free_agent_recommendations"].get(category_type, {})
         
         # Create visualization
-        fig, axs = plt.subplots(len(weaknesses), 1, figsize=(12, 5*len(weaknesses)))
+        fig = new_figure(figsize=(12, 5*len(weaknesses)))
+        axs = fig.subplots(len(weaknesses), 1)
         if len(weaknesses) == 1:
             axs = [axs]  # Make axs a list even if there's only one category
         
         for i, category in enumerate(weaknesses):
             if category in player_recs and player_recs[category]:
                 # Create a DataFrame for this category's recommendations
-                players = player_recs[category]
-                df = pd.DataFrame(players)
+                df = pd.DataFrame(player_recs[category])
                 
                 # Plot the recommendations
-                sns.barplot(x="name", y="value", data=df, ax=axs[i], palette="viridis")
+                sns.barplot(x="name", y="value", data=df, ax=axs[i],
+                            palette=self._viridis_palette(df["name"].nunique()))
                 axs[i].set_title(f"Recommended Players for {category}", fontsize=14)
                 axs[i].set_xlabel("Player", fontsize=12)
                 axs[i].set_ylabel(category, fontsize=12)
                 axs[i].tick_params(axis='x', rotation=45)
                 
                 # Add position labels
-                for j, player in enumerate(players):
-                    axs[i].text(j, 0.1, player["positions"], rotation=90, 
+                for j, positions in enumerate(df["positions"]):
+                    axs[i].text(j, 0.1, positions, rotation=90, 
                                ha='center', va='bottom', fontsize=9)
             else:
                 axs[i].text(0.5, 0.5, f"No recommendations available for {category}", 
                            ha='center', va='center', transform=axs[i].transAxes)
                 axs[i].set_title(f"Category: {category}", fontsize=14)
         
-        plt.suptitle(f"{category_type.capitalize()} Improvement Recommendations for {recommendations['team_name']}", 
+        fig.suptitle(f"{category_type.capitalize()} Improvement Recommendations for {recommendations['team_name']}", 
                      fontsize=16)
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Generate filename if not provided
         if filename is None:
             filename = f"improvement_recommendations_{category_type}_{recommendations['team_id']}.png"
         
         # Save the figure
-        output_path = os.path.join(self.output_dir, filename)
-        plt.savefig(output_path)
-        plt.close()
+        output_path = self._output_prefix + filename
+        save_png(fig, output_path)
         
         return output_path
\ No newline at end of file
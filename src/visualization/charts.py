@@ -1,5 +1,4 @@
 # src/visualization/charts.py
-import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
 from typing import List, Dict, Optional
@@ -7,22 +6,86 @@ import os
 
 from src.data.models import Team
 from src.data.processors import TeamDataProcessor
+from src.visualization.figures import ChartRenderer, render_barplot
 
 class TeamVisualizer:
     """Visualize team data."""
     
-    def __init__(self, output_dir: str = 'output'):
+    # Number of team lists whose DataFrames are kept between charts
+    DF_CACHE_SIZE = 4
+    
+    def __init__(self, output_dir: str = 'output', max_workers: Optional[int] = None):
         """
         Initialize the visualizer.
         
         Args:
             output_dir: Directory to save visualizations
+            max_workers: Render charts on this many worker processes; call
+                flush() before using the images and close() when done, or use
+                the visualizer as a context manager (default: render inline)
         """
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
+        # Output paths are built by concatenation against this prefix
+        self._output_prefix = os.path.join(output_dir, '')
         
         # Set up styling
         sns.set_style('whitegrid')
+        self._renderer = ChartRenderer(max_workers, style='whitegrid')
+        
+        # Team DataFrames keyed by id() of the source list
+        self._df_cache = {}
+    
+    def flush(self) -> List[str]:
+        """
+        Wait for charts queued on worker processes to be written.
+        
+        Returns:
+            list: Paths of the images rendered since the last flush
+        """
+        return self._renderer.flush()
+    
+    def close(self) -> None:
+        """Wait for queued charts and stop the worker processes, if any."""
+        self._renderer.shutdown()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def clear_cache(self) -> None:
+        """Forget cached team DataFrames (e.g. after standings are refreshed)."""
+        self._df_cache = {}
+    
+    def _get_df(self, teams: List[Team]) -> pd.DataFrame:
+        """
+        Get the DataFrame for a team list, converting each list only once.
+        
+        The cached frame is shared between charts and must not be modified;
+        a list is reconverted if its length changes.
+        
+        Args:
+            teams: List of Team objects
+            
+        Returns:
+            pd.DataFrame: DataFrame containing team data
+        """
+        cached = self._df_cache.get(id(teams))
+        if cached is not None and cached[0] is teams and cached[1] == len(teams):
+            return cached[2]
+        
+        df = TeamDataProcessor.teams_to_dataframe(teams)
+        # Team names label every chart; integer codes make sorting and copying
+        # the frame (and pickling it to render workers) cheaper
+        df['name'] = df['name'].astype('category')
+        
+        if len(self._df_cache) >= self.DF_CACHE_SIZE:
+            self._df_cache.pop(next(iter(self._df_cache)))
+        # Holding the list keeps its id() from being reused while cached
+        self._df_cache[id(teams)] = (teams, len(teams), df)
+        return df
         
     def visualize_standings(self, teams: List[Team], filename: str = 'standings.png') -> str:
         """
@@ -35,24 +98,15 @@ class TeamVisualizer:
         Returns:
             str: Path to generated image
         """
-        df = TeamDataProcessor.teams_to_dataframe(teams)
-        df = df.sort_values('standing')
-        
-        plt.figure(figsize=(12, 8))
-        # Update to follow the new seaborn API
-        ax = sns.barplot(x='name', y='wins', hue='name', data=df, palette='viridis', legend=False)
-        ax.set_title('Team Standings by Wins', fontsize=16)
-        ax.set_xlabel('Team', fontsize=12)
-        ax.set_ylabel('Wins', fontsize=12)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        
-        # Save the figure
-        output_path = os.path.join(self.output_dir, filename)
-        plt.savefig(output_path)
-        plt.close()
-        
-        return output_path
+        df = self._get_df(teams)
+        df = df.sort_values('standing', kind='stable')
+        
+        return self._renderer.submit(
+            render_barplot, output_path=self._output_prefix + filename,
+            data=df, x='name', y='wins', hue='name', palette='viridis',
+            title='Team Standings by Wins', xlabel='Team', ylabel='Wins',
+            rotate_xticks=True
+        )
     
     # Update the visualize_win_percentage method
     def visualize_win_percentage(self, teams: List[Team], filename: str = 'win_percentage.png') -> str:
@@ -66,25 +120,17 @@ class TeamVisualizer:
         Returns:
             str: Path to generated image
         """
-        df = TeamDataProcessor.teams_to_dataframe(teams)
-        df['win_percentage'] = df['wins'] / (df['wins'] + df['losses']) * 100
+        # teams_to_dataframe already computes win_percentage in a single
+        # np.divide pass (0 for teams with no games), so reuse it
+        df = self._get_df(teams)
         df = df.sort_values('win_percentage', ascending=False)
         
-        plt.figure(figsize=(12, 8))
-        # Update to follow the new seaborn API
-        ax = sns.barplot(x='name', y='win_percentage', hue='name', data=df, palette='coolwarm', legend=False)
-        ax.set_title('Team Win Percentages', fontsize=16)
-        ax.set_xlabel('Team', fontsize=12)
-        ax.set_ylabel('Win Percentage (%)', fontsize=12)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        
-        # Save the figure
-        output_path = os.path.join(self.output_dir, filename)
-        plt.savefig(output_path)
-        plt.close()
-        
-        return output_path
+        return self._renderer.submit(
+            render_barplot, output_path=self._output_prefix + filename,
+            data=df, x='name', y='win_percentage', hue='name', palette='coolwarm',
+            title='Team Win Percentages', xlabel='Team', ylabel='Win Percentage (%)',
+            rotate_xticks=True
+        )
     
     # Update the visualize_division_comparison method
     def visualize_division_comparison(
@@ -100,30 +146,20 @@ class TeamVisualizer:
         Returns:
             str: Path to generated image or None if no division data
         """
-        df = TeamDataProcessor.teams_to_dataframe(teams)
+        df = self._get_df(teams)
         
-        if 'division_name' not in df.columns or df['division_name'].isna().all():
+        # first_valid_index stops at the first named division without building a mask
+        if 'division_name' not in df.columns or df['division_name'].first_valid_index() is None:
             return None
         
-        # Group by division
-        division_stats = df.groupby('division_name').agg({
-            'wins': 'mean',
-            'losses': 'mean',
-            'win_percentage': 'mean'
-        }).reset_index()
-        
-        plt.figure(figsize=(10, 6))
-        # Update to follow the new seaborn API
-        ax = sns.barplot(x='division_name', y='win_percentage', hue='division_name', 
-                        data=division_stats, palette='deep', legend=False)
-        ax.set_title('Average Win Percentage by Division', fontsize=16)
-        ax.set_xlabel('Division', fontsize=12)
-        ax.set_ylabel('Average Win Percentage (%)', fontsize=12)
-        plt.tight_layout()
-        
-        # Save the figure
-        output_path = os.path.join(self.output_dir, filename)
-        plt.savefig(output_path)
-        plt.close()
-        
-        return output_path
\ No newline at end of file
+        # Group by division, reducing only the plotted column in a single pass
+        division_stats = df.groupby('division_name').agg(
+            win_percentage=('win_percentage', 'mean')
+        ).reset_index()
+        
+        return self._renderer.submit(
+            render_barplot, output_path=self._output_prefix + filename,
+            data=division_stats, x='division_name', y='win_percentage', hue='division_name',
+            palette='deep', title='Average Win Percentage by Division', xlabel='Division',
+            ylabel='Average Win Percentage (%)', figsize=(10, 6)
+        )
\ No newline at end of file
@@ -1,21 +1,265 @@
 # src/visualization/delivery.py
 import os
+import mmap
+import functools
+import time
+import atexit
 import logging
 import smtplib
+from email import encoders
+from email.mime.base import MIMEBase
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Attachments larger than this are memory-mapped instead of read into a bytes copy
+MMAP_THRESHOLD = 4 * 1024 * 1024
+
+@functools.lru_cache(maxsize=32)
+def _joined_recipients(recipients):
+    """
+    Join a recipient tuple into a To header value, cached for repeated broadcasts.
+    
+    Args:
+        recipients: Tuple of recipient email addresses
+        
+    Returns:
+        str: Comma-separated recipients
+    """
+    return ', '.join(recipients)
+
+@functools.lru_cache(maxsize=32)
+def _plain_text_part(body):
+    """
+    Build the encoded plain-text part for a body, cached so a reused body is
+    only encoded once. The returned part is shared and must not be modified.
+    
+    Args:
+        body: Email body content (plain text)
+        
+    Returns:
+        MIMEText: Plain-text MIME part
+    """
+    return MIMEText(body, 'plain')
+
+class SMTPSession:
+    """Reusable SMTP connection; connects and logs in once for many sends."""
+    
+    def __init__(self, smtp_server, smtp_port=587, username=None, password=None, use_tls=True):
+        """
+        Initialize the session.
+        
+        Args:
+            smtp_server: SMTP server address
+            smtp_port: SMTP server port (default: 587)
+            username: SMTP authentication username (optional)
+            password: SMTP authentication password (optional)
+            use_tls: Whether to use TLS encryption (default: True)
+        """
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.server = None
+    
+    def __enter__(self):
+        # Port 465 is implicit TLS, which skips the STARTTLS upgrade round-trip
+        if self.use_tls and int(self.smtp_port) == 465:
+            self.server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port)
+        else:
+            self.server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            if self.use_tls:
+                self.server.starttls()
+        
+        try:
+            # Login if credentials provided
+            if self.username and self.password:
+                self.server.login(self.username, self.password)
+        except Exception:
+            self.server.close()
+            self.server = None
+            raise
+        
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            self.server.quit()
+        except smtplib.SMTPException:
+            self.server.close()
+        finally:
+            self.server = None
+        return False
+    
+    def send(self, msg):
+        """
+        Send a message over the open connection.
+        
+        Args:
+            msg: Email message to send
+        """
+        if self.server is None:
+            raise RuntimeError("SMTP session is not open")
+        self.server.send_message(msg)
+
 class ReportDelivery:
     """Handle delivery of reports through various channels."""
     
+    # History log handle shared across log_to_history calls; closed at exit
+    _history_fp = None
+    _history_path = None
+    _history_atexit = False
+    
+    @staticmethod
+    def _build_attachment(file_path):
+        """
+        Build a base64-encoded MIME part for a file attachment.
+        
+        Args:
+            file_path: Path of the file to attach
+            
+        Returns:
+            MIMEBase: Encoded attachment part
+        """
+        filename = os.path.basename(file_path)
+        part = MIMEBase('application', 'octet-stream')
+        
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size > MMAP_THRESHOLD:
+                # Encode straight from the mapped pages to skip the userspace copy
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    part.set_payload(mapped)
+                    encoders.encode_base64(part)
+            else:
+                part.set_payload(file.read())
+                encoders.encode_base64(part)
+        
+        part.add_header('Content-Disposition', 'attachment', filename=filename)
+        return part
+    
+    @staticmethod
+    def _present_files(paths):
+        """
+        Find which of the given files exist, scanning each directory once.
+        
+        Args:
+            paths: File paths to check
+            
+        Returns:
+            dict: Directory -> set of regular file names present in it
+        """
+        present = {}
+        for directory in {os.path.dirname(path) or '.' for path in paths}:
+            try:
+                with os.scandir(directory) as entries:
+                    present[directory] = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                present[directory] = set()
+        return present
+    
+    @staticmethod
+    def _resolve_smtp_settings(smtp_server=None, smtp_port=None, username=None, password=None):
+        """
+        Fill in missing SMTP connection parameters from settings.
+        
+        Args:
+            smtp_server: SMTP server address (optional)
+            smtp_port: SMTP server port (optional)
+            username: SMTP authentication username (optional)
+            password: SMTP authentication password (optional)
+            
+        Returns:
+            tuple: (smtp_server, smtp_port, username, password)
+        """
+        # Import settings here to avoid circular imports
+        from config import settings
+        
+        if smtp_server is None:
+            smtp_server = getattr(settings, 'EMAIL_SMTP_SERVER', None)
+        if smtp_port is None:
+            smtp_port = getattr(settings, 'EMAIL_SMTP_PORT', 587)
+        if username is None:
+            username = getattr(settings, 'EMAIL_USERNAME', None)
+        if password is None:
+            password = getattr(settings, 'EMAIL_PASSWORD', None)
+        
+        return smtp_server, smtp_port, username, password
+    
+    @staticmethod
+    def smtp_session(smtp_server=None, smtp_port=None, username=None, password=None, use_tls=True):
+        """
+        Open an SMTP session that can send several messages over one connection.
+        
+        Usage:
+            with ReportDelivery.smtp_session() as session:
+                session.send(msg1)
+                session.send(msg2)
+        
+        Args:
+            smtp_server: SMTP server address (optional)
+            smtp_port: SMTP server port (optional)
+            username: SMTP authentication username (optional)
+            password: SMTP authentication password (optional)
+            use_tls: Whether to use TLS encryption (default: True)
+            
+        Returns:
+            SMTPSession: Context manager wrapping the connection
+        """
+        return SMTPSession(*ReportDelivery._resolve_smtp_settings(
+            smtp_server, smtp_port, username, password), use_tls=use_tls)
+    
+    @staticmethod
+    def build_message(subject, body, recipients, sender, attachments=None, html_content=None):
+        """
+        Build an email message with optional HTML content and attachments.
+        
+        Args:
+            subject: Email subject
+            body: Email body content (plain text)
+            recipients: List of recipient email addresses
+            sender: Sender email address
+            attachments: List of file paths to attach (optional)
+            html_content: HTML version of the email (optional)
+            
+        Returns:
+            MIMEMultipart: Message ready to send
+        """
+        # Pick the top-level container up front: mixed when there are
+        # attachments (wrapping the text/HTML alternative), else alternative
+        msg = MIMEMultipart('mixed' if attachments else 'alternative')
+        msg['From'] = sender
+        msg['To'] = _joined_recipients(tuple(recipients))
+        msg['Subject'] = subject
+        
+        body_part = MIMEMultipart('alternative') if attachments else msg
+        
+        # Add plain text body
+        body_part.attach(_plain_text_part(body))
+        
+        # Add HTML body if provided
+        if html_content:
+            body_part.attach(MIMEText(html_content, 'html'))
+        
+        if attachments:
+            msg.attach(body_part)
+            
+            # Add attachments, listing each directory once instead of
+            # stat-ing every file
+            present = ReportDelivery._present_files(attachments)
+            for file_path in attachments:
+                if os.path.basename(file_path) in present.get(os.path.dirname(file_path) or '.', ()):
+                    msg.attach(ReportDelivery._build_attachment(file_path))
+                else:
+                    logger.warning(f"Attachment not found: {file_path}")
+        
+        return msg
+    
     @staticmethod
     def deliver_email(subject, body, recipients, sender=None, smtp_server=None, 
                      smtp_port=None, username=None, password=None, 
-                     attachments=None, use_tls=True, html_content=None):
+                     attachments=None, use_tls=True, html_content=None, session=None):
         """
         Send a report via email.
         
@@ -31,6 +275,8 @@ class ReportDelivery:
             attachments: List of file paths to attach (optional)
             use_tls: Whether to use TLS encryption (default: True)
             html_content: HTML version of the email (optional)
+            session: Open SMTPSession to send through (optional); when omitted
+                a one-shot session is opened for this email
             
         Returns:
             bool: True if email was sent successfully, False otherwise
@@ -41,72 +287,27 @@ class ReportDelivery:
         # Use settings for missing parameters
         if sender is None:
             sender = getattr(settings, 'EMAIL_FROM', None)
-        if smtp_server is None:
-            smtp_server = getattr(settings, 'EMAIL_SMTP_SERVER', None)
-        if smtp_port is None:
-            smtp_port = getattr(settings, 'EMAIL_SMTP_PORT', 587)
-        if username is None:
-            username = getattr(settings, 'EMAIL_USERNAME', None)
-        if password is None:
-            password = getattr(settings, 'EMAIL_PASSWORD', None)
+        if session is None:
+            smtp_server, smtp_port, username, password = ReportDelivery._resolve_smtp_settings(
+                smtp_server, smtp_port, username, password)
         
         # Validate required parameters
-        if not sender or not recipients or not smtp_server:
+        if not sender or not recipients or (session is None and not smtp_server):
             logger.error("Missing required email parameters")
             return False
         
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['From'] = sender
-            msg['To'] = ', '.join(recipients)
-            msg['Subject'] = subject
-            
-            # Add plain text body
-            msg.attach(MIMEText(body, 'plain'))
-            
-            # Add HTML body if provided
-            if html_content:
-                msg.attach(MIMEText(html_content, 'html'))
-            
-            # If there are attachments, convert to mixed multipart
-            if attachments:
-                # Create a new mixed message
-                mixed_msg = MIMEMultipart('mixed')
-                # Copy the headers
-                for key, value in msg.items():
-                    mixed_msg[key] = value
-                
-                # Attach the alternative part (plain text and HTML)
-                mixed_msg.attach(msg)
-                
-                # Add attachments
-                for file_path in attachments:
-                    if os.path.exists(file_path):
-                        with open(file_path, 'rb') as file:
-                            part = MIMEApplication(file.read(), Name=os.path.basename(file_path))
-                            part['Content-Disposition'] = f'attachment; filename="{os.path.basename(file_path)}"'
-                            mixed_msg.attach(part)
-                    else:
-                        logger.warning(f"Attachment not found: {file_path}")
-                
-                # Replace the message with the mixed multipart
-                msg = mixed_msg
-            
-            # Connect to server and send
-            server = smtplib.SMTP(smtp_server, smtp_port)
-            if use_tls:
-                server.starttls()
-            
-            # Login if credentials provided
-            if username and password:
-                server.login(username, password)
+            msg = ReportDelivery.build_message(subject, body, recipients, sender,
+                                               attachments=attachments, html_content=html_content)
             
-            # Send email
-            server.send_message(msg)
-            server.quit()
+            # Send over the caller's session, or connect just for this email
+            if session is not None:
+                session.send(msg)
+            else:
+                with SMTPSession(smtp_server, smtp_port, username, password, use_tls=use_tls) as one_shot:
+                    one_shot.send(msg)
             
-            logger.info(f"Email sent to {', '.join(recipients)}")
+            logger.info(f"Email sent to {msg['To']}")
             return True
             
         except Exception as e:
@@ -138,8 +339,36 @@ class ReportDelivery:
             logger.error(f"Failed to save report: {str(e)}")
             return False
 
-    @staticmethod
-    def log_to_history(report_type, summary, output_path):
+    @classmethod
+    def _get_history_fp(cls, history_path):
+        """
+        Get the append-mode history file, opening it on first use.
+        
+        Args:
+            history_path: Path to the history log
+            
+        Returns:
+            file: Line-buffered text file opened for appending
+        """
+        if cls._history_fp is None or cls._history_fp.closed or cls._history_path != history_path:
+            cls._close_history()
+            cls._history_fp = open(history_path, 'a', buffering=1)
+            cls._history_path = history_path
+            if not cls._history_atexit:
+                atexit.register(cls._close_history)
+                cls._history_atexit = True
+        return cls._history_fp
+    
+    @classmethod
+    def _close_history(cls):
+        """Close the cached history file, if open."""
+        if cls._history_fp is not None:
+            cls._history_fp.close()
+            cls._history_fp = None
+            cls._history_path = None
+
+    @classmethod
+    def log_to_history(cls, report_type, summary, output_path):
         """
         Log report to history file for tracking.
         
@@ -157,20 +386,19 @@ class ReportDelivery:
             
             # Determine history file location
             history_dir = getattr(settings, 'REPORT_DIR', 'reports')
-            os.makedirs(history_dir, exist_ok=True)
-            
             history_path = os.path.join(history_dir, 'report_history.log')
+            if cls._history_path != history_path:
+                os.makedirs(history_dir, exist_ok=True)
             
             # Format log entry
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
             log_entry = f"{timestamp} | {report_type} | {summary} | {output_path}\n"
             
-            # Append to history file
-            with open(history_path, 'a') as f:
-                f.write(log_entry)
+            # Append to the history file, kept open across calls
+            cls._get_history_fp(history_path).write(log_entry)
             
             return True
             
         except Exception as e:
             logger.error(f"Failed to log to history: {str(e)}")
-            return False
\ No newline at end of file
+            return False
@@ -0,0 +1,275 @@
+# src/visualization/figures.py
+"""
+Helpers for drawing charts on Agg canvases without pyplot's global figure state.
+"""
+
+import io
+import os
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import seaborn as sns
+from matplotlib.artist import setp
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# PNG output settings: screen resolution and fast zlib compression, since
+# encoding dominates save time and reports are compressed again in transit
+PNG_DPI = 96
+PNG_COMPRESS_LEVEL = 1
+
+# Bar geometry and color saturation matching sns.barplot defaults
+BAR_WIDTH = 0.8
+BAR_SATURATION = 0.75
+
+def new_figure(figsize: Optional[Tuple[float, float]] = None) -> Figure:
+    """
+    Create a figure attached to an Agg canvas, bypassing pyplot's figure manager.
+    
+    The figure is not registered with pyplot, so it needs no plt.close() and is
+    freed as soon as the caller drops its reference.
+    
+    Args:
+        figsize: Figure size in inches (defaults to rcParams)
+        
+    Returns:
+        Figure: New matplotlib figure
+    """
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+def save_png(fig: Figure, output_path: str) -> str:
+    """
+    Save a figure as a quickly encoded PNG.
+    
+    The image is encoded into memory and written with one sequential write to
+    a temporary file, which is then renamed over output_path, so readers never
+    see a partially written chart.
+    
+    Args:
+        fig: Figure to save
+        output_path: Path to write the image to
+        
+    Returns:
+        str: Path to the saved image
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=PNG_DPI, metadata={'Software': None},
+                pil_kwargs={'optimize': False, 'compress_level': PNG_COMPRESS_LEVEL})
+    
+    # Per-process temp name so concurrent render workers never share one
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(buffer.getbuffer())
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return output_path
+
+def render_barplot(
+    output_path: str, data: pd.DataFrame, x: str, y: str, hue: str, palette: str,
+    title: str, xlabel: str, ylabel: str, figsize: Tuple[float, float] = (12, 8),
+    rotate_xticks: bool = False, legend_title: Optional[str] = None
+) -> str:
+    """
+    Draw a bar chart of pre-aggregated values and save it to disk.
+    
+    Bars are drawn with ax.bar directly; unlike sns.barplot this skips the
+    per-group aggregation and bootstrapped confidence intervals, which are
+    meaningless for one value per bar. Bars keep data order, and when hue
+    differs from x they are grouped side by side per x value.
+    
+    This is a top-level function so it can be pickled and run in a worker process.
+    
+    Args:
+        output_path: Path to write the image to
+        data: Data to plot, one row per bar
+        x: Column for the x axis
+        y: Column for the bar heights
+        hue: Column used for bar colors
+        palette: Seaborn palette name
+        title: Chart title
+        xlabel: X axis label
+        ylabel: Y axis label
+        figsize: Figure size in inches
+        rotate_xticks: Rotate x tick labels 45 degrees
+        legend_title: Show a legend with this title (no legend if None)
+        
+    Returns:
+        str: Path to generated image
+    """
+    fig = new_figure(figsize=figsize)
+    ax = fig.add_subplot(111)
+    
+    if hue == x:
+        # One bar per row, each in its own palette color
+        labels = data[x].to_numpy()
+        positions = np.arange(len(labels))
+        ax.bar(positions, data[y].to_numpy(dtype=float), width=BAR_WIDTH,
+               color=sns.color_palette(palette, len(labels), desat=BAR_SATURATION))
+    else:
+        # Grouped bars: one group per x value, one bar per hue level
+        labels = pd.unique(data[x])
+        hue_levels = pd.unique(data[hue])
+        heights = data.pivot_table(index=hue, columns=x, values=y, sort=False).reindex(
+            index=hue_levels, columns=labels).to_numpy(dtype=float)
+        positions = _draw_grouped_bars(ax, heights, hue_levels, palette)
+    
+    _finish_bar_axes(ax, positions, labels, title, xlabel, ylabel, rotate_xticks, legend_title)
+    fig.tight_layout()
+    
+    return save_png(fig, output_path)
+
+def render_grouped_barplot(
+    output_path: str, labels: List[str], groups: List[str], values: np.ndarray,
+    palette: str, title: str, xlabel: str, ylabel: str,
+    figsize: Tuple[float, float] = (12, 8), rotate_xticks: bool = False,
+    legend_title: Optional[str] = None
+) -> str:
+    """
+    Draw grouped bars straight from a value matrix and save it to disk.
+    
+    Args:
+        output_path: Path to write the image to
+        labels: X axis label for each bar group
+        groups: Legend name for each row of values
+        values: Bar heights, shape (len(groups), len(labels))
+        palette: Seaborn palette name, one color per group
+        title: Chart title
+        xlabel: X axis label
+        ylabel: Y axis label
+        figsize: Figure size in inches
+        rotate_xticks: Rotate x tick labels 45 degrees
+        legend_title: Show a legend with this title (no legend if None)
+        
+    Returns:
+        str: Path to generated image
+    """
+    fig = new_figure(figsize=figsize)
+    ax = fig.add_subplot(111)
+    
+    positions = _draw_grouped_bars(ax, np.asarray(values, dtype=float), groups, palette)
+    
+    _finish_bar_axes(ax, positions, labels, title, xlabel, ylabel, rotate_xticks, legend_title)
+    fig.tight_layout()
+    
+    return save_png(fig, output_path)
+
+def _draw_grouped_bars(ax, heights: np.ndarray, groups, palette: str) -> np.ndarray:
+    """
+    Draw one row of heights per group, side by side within each x position.
+    
+    Args:
+        ax: Axes to draw on
+        heights: Bar heights, shape (n_groups, n_positions)
+        groups: Legend label for each row
+        palette: Seaborn palette name
+        
+    Returns:
+        np.ndarray: X positions of the bar groups
+    """
+    positions = np.arange(heights.shape[1])
+    width = BAR_WIDTH / len(groups)
+    offsets = (np.arange(len(groups)) + 0.5) * width - BAR_WIDTH / 2
+    colors = sns.color_palette(palette, len(groups), desat=BAR_SATURATION)
+    for group, offset, group_heights, color in zip(groups, offsets, heights, colors):
+        ax.bar(positions + offset, group_heights, width=width, color=color, label=str(group))
+    return positions
+
+def _finish_bar_axes(
+    ax, positions: np.ndarray, labels, title: str, xlabel: str, ylabel: str,
+    rotate_xticks: bool, legend_title: Optional[str]
+) -> None:
+    """Label a bar chart's categorical x axis, titles and optional legend."""
+    ax.set_xticks(positions)
+    ax.set_xticklabels([str(label) for label in labels])
+    ax.set_xlim(-0.5, len(labels) - 0.5)
+    ax.xaxis.grid(False)
+    
+    ax.set_title(title, fontsize=16)
+    ax.set_xlabel(xlabel, fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+    if rotate_xticks:
+        setp(ax.get_xticklabels(), rotation=45, ha='right')
+    if legend_title is not None:
+        ax.legend(title=legend_title)
+
+def _init_render_worker(style: str) -> None:
+    """Apply the parent's seaborn style in a freshly spawned worker."""
+    sns.set_style(style)
+
+class ChartRenderer:
+    """
+    Run chart render functions inline or on a pool of worker processes.
+    
+    With max_workers unset, charts are rendered synchronously. Otherwise each
+    render is submitted to a spawned process pool and flush() must be called
+    before the output files are used.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, style: str = 'whitegrid'):
+        """
+        Initialize the renderer.
+        
+        Args:
+            max_workers: Number of worker processes (None or 0 renders inline)
+            style: Seaborn style applied in each worker
+        """
+        self.max_workers = max_workers
+        self.style = style
+        self._pool = None
+        self._pending: List[Future] = []
+    
+    def submit(self, render_func, **kwargs) -> str:
+        """
+        Render a chart, or queue it on the worker pool.
+        
+        Args:
+            render_func: Top-level render function taking output_path
+            **kwargs: Arguments for render_func
+            
+        Returns:
+            str: Path the image is (or will be) written to
+        """
+        if not self.max_workers:
+            return render_func(**kwargs)
+        
+        if self._pool is None:
+            # spawn avoids inheriting matplotlib state across fork
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_render_worker,
+                initargs=(self.style,)
+            )
+        self._pending.append(self._pool.submit(render_func, **kwargs))
+        return kwargs['output_path']
+    
+    def flush(self) -> List[str]:
+        """
+        Wait for all queued renders to finish.
+        
+        Returns:
+            list: Paths of the images rendered since the last flush
+        
+        Raises:
+            Exception: The first error raised by a queued render
+        """
+        pending, self._pending = self._pending, []
+        return [future.result() for future in pending]
+    
+    def shutdown(self) -> None:
+        """Wait for queued renders and stop the worker pool."""
+        try:
+            self.flush()
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
@@ -1,5 +1,4 @@
 # src/visualization/player_charts.py
-import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
 import numpy as np
@@ -8,22 +7,89 @@ import os
 
 from src.data.models import Player
 from src.data.processors import PlayerDataProcessor
+from src.visualization.figures import ChartRenderer, render_barplot, render_grouped_barplot
 
 class PlayerVisualizer:
     """Visualize player data."""
     
-    def __init__(self, output_dir: str = 'output'):
+    # Number of player lists whose DataFrames are kept between charts
+    DF_CACHE_SIZE = 4
+    
+    def __init__(self, output_dir: str = 'output', max_workers: Optional[int] = None):
         """
         Initialize the visualizer.
         
         Args:
             output_dir: Directory to save visualizations
+            max_workers: Render charts on this many worker processes; call
+                flush() before using the images and close() when done, or use
+                the visualizer as a context manager (default: render inline)
         """
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
+        # Output paths are built by concatenation against this prefix
+        self._output_prefix = os.path.join(output_dir, '')
         
         # Set up styling
         sns.set_style('whitegrid')
+        self._renderer = ChartRenderer(max_workers, style='whitegrid')
+        
+        # Player DataFrames keyed by id() of the source list
+        self._df_cache = {}
+    
+    def flush(self) -> List[str]:
+        """
+        Wait for charts queued on worker processes to be written.
+        
+        Returns:
+            list: Paths of the images rendered since the last flush
+        """
+        return self._renderer.flush()
+    
+    def close(self) -> None:
+        """Wait for queued charts and stop the worker processes, if any."""
+        self._renderer.shutdown()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def clear_cache(self) -> None:
+        """Forget cached player DataFrames (e.g. after stats are refreshed)."""
+        self._df_cache = {}
+    
+    def _get_df(self, players: List[Player]) -> pd.DataFrame:
+        """
+        Get the DataFrame for a player list, converting each list only once.
+        
+        The cached frame is shared between charts and must not be modified;
+        a list is reconverted if its length changes.
+        
+        Args:
+            players: List of Player objects
+            
+        Returns:
+            pd.DataFrame: DataFrame containing player data and primary_position
+        """
+        cached = self._df_cache.get(id(players))
+        if cached is not None and cached[0] is players and cached[1] == len(players):
+            return cached[2]
+        
+        df = PlayerDataProcessor.players_to_dataframe(players)
+        
+        # Extract primary position (first position listed)
+        if 'positions' in df.columns:
+            df['primary_position'] = (
+                df['positions'].str.partition(',')[0].str.strip().astype('category')
+            )
+        
+        if len(self._df_cache) >= self.DF_CACHE_SIZE:
+            self._df_cache.pop(next(iter(self._df_cache)))
+        # Holding the list keeps its id() from being reused while cached
+        self._df_cache[id(players)] = (players, len(players), df)
+        return df
     
     def visualize_top_players(
         self, players: List[Player], stat: str, limit: int = 10, 
@@ -42,40 +108,31 @@ class PlayerVisualizer:
         Returns:
             str: Path to generated image
         """
-        df = PlayerDataProcessor.players_to_dataframe(players)
+        df = self._get_df(players)
         
         # Check if stat exists
         if stat not in df.columns:
             available_stats = [col for col in df.columns 
-                              if col not in ['player_id', 'name', 'team', 'positions']]
+                              if col not in ['player_id', 'name', 'team', 'positions', 'primary_position']]
             raise ValueError(f"Stat '{stat}' not found. Available stats: {available_stats}")
         
-        # Filter out rows with NaN values for this stat
-        df = df[df[stat].notna()]
-        
-        # Sort and limit
-        df = df.sort_values(stat, ascending=ascending).head(limit)
-        
-        # Create visualization
-        plt.figure(figsize=(12, 8))
-        ax = sns.barplot(x='name', y=stat, hue='name', data=df, palette='viridis', legend=False)
-        ax.set_title(f"Top {limit} Players by {stat}", fontsize=16)
-        ax.set_xlabel('Player', fontsize=12)
-        ax.set_ylabel(stat, fontsize=12)
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        # Drop players without this stat, then select the top (or bottom) rows
+        # with a partial selection instead of sorting the whole pool
+        df = df.dropna(subset=[stat])
+        df = df.nsmallest(limit, stat) if ascending else df.nlargest(limit, stat)
         
         # Generate filename if not provided
         if filename is None:
             order = "bottom" if ascending else "top"
             filename = f"{order}_{limit}_players_by_{stat}.png"
         
-        # Save the figure
-        output_path = os.path.join(self.output_dir, filename)
-        plt.savefig(output_path)
-        plt.close()
-        
-        return output_path
+        # Create visualization
+        return self._renderer.submit(
+            render_barplot, output_path=self._output_prefix + filename,
+            data=df, x='name', y=stat, hue='name', palette='viridis',
+            title=f"Top {limit} Players by {stat}", xlabel='Player', ylabel=stat,
+            rotate_xticks=True
+        )
     
     def visualize_position_comparison(
         self, players: List[Player], stat: str, filename: Optional[str] = None
@@ -91,40 +148,31 @@ class PlayerVisualizer:
         Returns:
             str: Path to generated image
         """
-        df = PlayerDataProcessor.players_to_dataframe(players)
+        df = self._get_df(players)
         
         # Check if stat exists
         if stat not in df.columns:
             available_stats = [col for col in df.columns 
-                              if col not in ['player_id', 'name', 'team', 'positions']]
+                              if col not in ['player_id', 'name', 'team', 'positions', 'primary_position']]
             raise ValueError(f"Stat '{stat}' not found. Available stats: {available_stats}")
         
-        # Extract primary position (first position listed)
-        df['primary_position'] = df['positions'].str.split(',').str[0].str.strip()
-        
         # Group by position and calculate mean
-        position_stats = df.groupby('primary_position')[stat].mean().reset_index()
+        position_stats = df.groupby('primary_position', observed=True)[stat].mean().reset_index()
+        # Plain strings so seaborn orders bars by value rather than by category
+        position_stats['primary_position'] = position_stats['primary_position'].astype(str)
         position_stats = position_stats.sort_values(stat, ascending=False)
         
-        # Create visualization
-        plt.figure(figsize=(12, 8))
-        ax = sns.barplot(x='primary_position', y=stat, hue='primary_position', 
-                         data=position_stats, palette='deep', legend=False)
-        ax.set_title(f"Average {stat} by Position", fontsize=16)
-        ax.set_xlabel('Position', fontsize=12)
-        ax.set_ylabel(f"Average {stat}", fontsize=12)
-        plt.tight_layout()
-        
         # Generate filename if not provided
         if filename is None:
             filename = f"position_comparison_{stat}.png"
         
-        # Save the figure
-        output_path = os.path.join(self.output_dir, filename)
-        plt.savefig(output_path)
-        plt.close()
-        
-        return output_path
+        # Create visualization
+        return self._renderer.submit(
+            render_barplot, output_path=self._output_prefix + filename,
+            data=position_stats, x='primary_position', y=stat, hue='primary_position',
+            palette='deep', title=f"Average {stat} by Position", xlabel='Position',
+            ylabel=f"Average {stat}"
+        )
     
     def visualize_player_comparison(
         self, player1: Player, player2: Player, stats: List[str], 
@@ -146,50 +194,31 @@ class PlayerVisualizer:
         df1 = PlayerDataProcessor.players_to_dataframe([player1])
         df2 = PlayerDataProcessor.players_to_dataframe([player2])
         
-        # Check which stats are available for both players
-        available_stats = []
-        for stat in stats:
-            if stat in df1.columns and stat in df2.columns:
-                available_stats.append(stat)
+        # Check which stats are available for both players, keeping the requested order
+        common_columns = set(df1.columns) & set(df2.columns)
+        available_stats = [stat for stat in stats if stat in common_columns]
         
         if not available_stats:
             raise ValueError("No common statistics found for comparison")
         
-        # Create data for visualization
-        comparison_data = []
-        for stat in available_stats:
-            comparison_data.append({
-                'stat': stat,
-                'value': df1[stat].iloc[0],
-                'player': df1['name'].iloc[0]
-            })
-            comparison_data.append({
-                'stat': stat,
-                'value': df2[stat].iloc[0],
-                'player': df2['name'].iloc[0]
-            })
-        
-        comparison_df = pd.DataFrame(comparison_data)
-        
-        # Create visualization
-        plt.figure(figsize=(14, 10))
-        ax = sns.barplot(x='stat', y='value', hue='player', data=comparison_df, palette='Set1')
-        ax.set_title(f"Player Comparison: {df1['name'].iloc[0]} vs {df2['name'].iloc[0]}", fontsize=16)
-        ax.set_xlabel('Statistic', fontsize=12)
-        ax.set_ylabel('Value', fontsize=12)
-        plt.xticks(rotation=45, ha='right')
-        plt.legend(title='Player')
-        plt.tight_layout()
+        # One row of values per player; bars are grouped by stat
+        player_names = [df1['name'].iloc[0], df2['name'].iloc[0]]
+        values = np.vstack([
+            df1[available_stats].iloc[0].to_numpy(dtype=float),
+            df2[available_stats].iloc[0].to_numpy(dtype=float)
+        ])
         
         # Generate filename if not provided
         if filename is None:
-            player1_name = df1['name'].iloc[0].replace(' ', '_')
-            player2_name = df2['name'].iloc[0].replace(' ', '_')
+            player1_name = player_names[0].replace(' ', '_')
+            player2_name = player_names[1].replace(' ', '_')
             filename = f"comparison_{player1_name}_vs_{player2_name}.png"
         
-        # Save the figure
-        output_path = os.path.join(self.output_dir, filename)
-        plt.savefig(output_path)
-        plt.close()
-        
-        return output_path
\ No newline at end of file
+        # Create visualization
+        return self._renderer.submit(
+            render_grouped_barplot, output_path=self._output_prefix + filename,
+            labels=available_stats, groups=player_names, values=values, palette='Set1',
+            title=f"Player Comparison: {player_names[0]} vs {player_names[1]}",
+            xlabel='Statistic', ylabel='Value', figsize=(14, 10), rotate_xticks=True,
+            legend_title='Player'
+        )
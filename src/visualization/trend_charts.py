@@ -1,15 +1,144 @@
 # src/visualization/trend_charts.py
-import matplotlib.pyplot as plt
+import matplotlib
 import seaborn as sns
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union, Iterator
 import os
+import functools
+import threading
+import importlib.util
+from contextlib import contextmanager
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import matplotlib.dates as mdates
-from datetime import datetime, timedelta
+
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
+
+from src.visualization.figures import new_figure, save_png
+
+# pandas can run rolling means through Numba kernels when it is installed;
+# checked without importing it, as pandas loads numba itself on first use
+HAS_NUMBA = importlib.util.find_spec('numba') is not None
+
+# Series shorter than this use the default Cython rolling engine, where
+# Numba's JIT compile cost would outweigh its faster kernel
+_ROLL_ENGINE_THRESHOLD = 2000
+
+def _rolling_mean(data, window: int):
+    """
+    Rolling mean of a Series or DataFrame, using the Numba engine for long data.
+    
+    Args:
+        data: Series or DataFrame to roll
+        window: Window size
+        
+    Returns:
+        Series or DataFrame: Rolling mean (NaN until the window is full)
+    """
+    rolling = data.rolling(window=window)
+    if HAS_NUMBA and len(data) >= _ROLL_ENGINE_THRESHOLD:
+        return rolling.mean(engine='numba', engine_kwargs={'nopython': True, 'nogil': True})
+    return rolling.mean()
+
+@functools.lru_cache(maxsize=64)
+def _parse_dates(dates: Tuple[str, ...]) -> pd.DatetimeIndex:
+    """
+    Parse YYYY-MM-DD date strings, caching the result per date sequence.
+    
+    Several charts for the same player usually share one date list, so it
+    is parsed once. The returned index is immutable and safe to share.
+    
+    Args:
+        dates: Date strings in chronological order
+        
+    Returns:
+        pd.DatetimeIndex: Parsed dates
+    """
+    return pd.to_datetime(list(dates), format="%Y-%m-%d", cache=True)
+
+def _trend_stats(values: np.ndarray) -> Tuple[np.ndarray, float, Optional[float]]:
+    """
+    Trend summary for a series: least-squares line and the latest value's change.
+    
+    Args:
+        values: Stat values in chronological order
+        
+    Returns:
+        tuple: (trend line values, last value, percent change of the last value
+            versus the mean of the earlier ones; None with fewer than 3 values
+            or a zero earlier mean)
+    """
+    # Closed-form degree-1 fit around the means
+    x_centered = np.arange(len(values), dtype=np.float64) - (len(values) - 1) / 2
+    y_mean = values.mean()
+    x_var = (x_centered ** 2).sum()
+    slope = (x_centered * (values - y_mean)).sum() / x_var if x_var else 0.0
+    trend = slope * x_centered + y_mean
+    
+    last_value = values[-1]
+    percent_change = None
+    if len(values) >= 3:
+        avg_value = values[:-1].mean()
+        if avg_value != 0:
+            percent_change = (last_value - avg_value) / avg_value * 100
+    
+    return trend, last_value, percent_change
+
+def _kde_curve(values: np.ndarray, gridsize: int = 200) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Gaussian kernel density estimate over the data range (Scott's bandwidth).
+    
+    Args:
+        values: Finite sample values
+        gridsize: Number of evaluation points
+        
+    Returns:
+        tuple: (support, density), or None if the sample has no spread
+    """
+    if len(values) < 2:
+        return None
+    bandwidth = values.std(ddof=1) * len(values) ** (-1 / 5)
+    if not bandwidth > 0:
+        return None
+    
+    support = np.linspace(values.min(), values.max(), gridsize)
+    z = (support[:, None] - values[None, :]) / bandwidth
+    density = np.exp(-0.5 * z * z).mean(axis=1) / (bandwidth * np.sqrt(2 * np.pi))
+    return support, density
+
+# Render settings applied while each chart is drawn: the seaborn whitegrid
+# style (resolved once here instead of set_style per instance), dense line
+# paths simplified to within a pixel, and long paths stroked in chunks
+_RENDER_RC = {
+    **sns.axes_style('whitegrid'),
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000
+}
+
+# rcParams are process-global and several of the settings above are only
+# read while drawing, so charts from different threads take turns instead of
+# restoring each other's settings mid-draw
+_RENDER_LOCK = threading.RLock()
+
+def _styled_render(method):
+    """Run a chart method under _RENDER_RC, one chart at a time."""
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with _RENDER_LOCK, matplotlib.rc_context(_RENDER_RC):
+            return method(*args, **kwargs)
+    return wrapper
 
 class TrendVisualizer:
-    """Visualize player and team performance trends over time."""
+    """
+    Visualize player and team performance trends over time.
+    
+    Charts are drawn under temporary global rcParams, so concurrent calls
+    from several threads are serialized; use visualize_players_bulk to
+    render in parallel on worker processes.
+    """
     
     def __init__(self, output_dir: str = 'output'):
         """
@@ -20,16 +149,95 @@ class TrendVisualizer:
         """
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
+        # Output paths are built by concatenation against this prefix
+        self._output_prefix = os.path.join(output_dir, '')
+        
+        # Idle figures reused between charts, keyed by size; a figure is
+        # taken out of the cache while a chart is drawn on it
+        self._fig_cache: Dict[Tuple[float, float], Figure] = {}
+    
+    def clear_cache(self) -> None:
+        """Forget reusable figures."""
+        self._fig_cache = {}
+    
+    @contextmanager
+    def _figure(self, figsize: Tuple[float, float]) -> Iterator[Figure]:
+        """
+        Draw one chart on a blank figure of the given size.
         
-        # Set up styling
-        sns.set_style('whitegrid')
-        plt.rcParams['figure.figsize'] = (12, 8)
+        The figure is reused from an earlier chart when one is idle. On exit
+        it is cleared, dropping the chart's artists and data, and returned to
+        the cache.
+        
+        Args:
+            figsize: Figure size in inches
+            
+        Yields:
+            Figure: Blank figure attached to an Agg canvas
+        """
+        fig = self._fig_cache.pop(figsize, None)
+        if fig is None:
+            fig = new_figure(figsize=figsize)
+        try:
+            yield fig
+        finally:
+            fig.clear()
+            self._fig_cache[figsize] = fig
+    
+    @staticmethod
+    def _percentile_rank(player_value: float, sorted_values: np.ndarray) -> float:
+        """
+        Percentage of comparison values strictly below the player's value.
+        
+        Args:
+            player_value: Player's value for the stat
+            sorted_values: Comparison values as a sorted float array (NaNs last)
+            
+        Returns:
+            float: Percentile (0-100)
+        """
+        # NaN compares false with everything, so no value is below it
+        if np.isnan(player_value):
+            return 0.0
+        
+        below = int(np.searchsorted(sorted_values, player_value, side='left'))
+        return below / len(sorted_values) * 100
     
+    def visualize_players_bulk(
+        self, jobs: List[Dict[str, Any]], max_workers: Optional[int] = None
+    ) -> List[str]:
+        """
+        Render many player trend charts on a pool of worker processes.
+        
+        Args:
+            jobs: Keyword arguments for visualize_player_trend, one dict per chart
+            max_workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            list: Paths of the generated images, in job order
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        
+        # Not worth starting a pool for a single chart
+        if len(jobs) <= 1 or max_workers <= 1:
+            return [self.visualize_player_trend(**job) for job in jobs]
+        
+        # Workers don't see self, so each job carries the output directory;
+        # spawn avoids inheriting matplotlib state across fork
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(jobs)),
+            mp_context=multiprocessing.get_context('spawn')
+        ) as executor:
+            return list(executor.map(_render_player_trend,
+                                     [(self.output_dir, job) for job in jobs]))
+    
+    @_styled_render
     def visualize_player_trend(
-        self, player_name: str, stat: str, stat_values: List[float], 
+        self, player_name: str, stat: str, stat_values: Union[List[float], np.ndarray], 
         dates: List[str], rolling_window: int = 7,
         filename: Optional[str] = None, include_expected: bool = False,
-        expected_values: Optional[List[float]] = None
+        expected_values: Optional[Union[List[float], np.ndarray]] = None
     ) -> str:
         """
         Visualize a player's performance trend over time.
@@ -37,24 +245,27 @@ class TrendVisualizer:
         Args:
             player_name: Name of the player
             stat: Name of the statistic being visualized
-            stat_values: List of stat values in chronological order
+            stat_values: Stat values in chronological order (list or array)
             dates: List of date strings corresponding to stat values
             rolling_window: Window size for rolling average
             filename: Output filename
             include_expected: Whether to include expected stats (xStats)
-            expected_values: List of expected stat values (required if include_expected is True)
+            expected_values: Expected stat values, list or array (required if include_expected is True)
             
         Returns:
             str: Path to generated image
         """
-        if include_expected and not expected_values:
+        if include_expected and (expected_values is None or len(expected_values) == 0):
             raise ValueError("expected_values must be provided if include_expected is True")
         
         if len(stat_values) != len(dates):
             raise ValueError("stat_values and dates must have same length")
+        
+        # Work on contiguous float arrays (no copy when given one already)
+        stat_values = np.ascontiguousarray(stat_values, dtype=np.float64)
             
-        # Convert dates to datetime objects
-        date_objects = [datetime.strptime(date, "%Y-%m-%d") for date in dates]
+        # Parse all dates in one vectorized call, reusing earlier parses
+        date_objects = _parse_dates(tuple(dates))
         
         # Create DataFrame
         df = pd.DataFrame({
@@ -66,84 +277,82 @@ class TrendVisualizer:
         if include_expected:
             if len(expected_values) != len(dates):
                 raise ValueError("expected_values and dates must have same length")
-            df['expected'] = expected_values
+            df['expected'] = np.ascontiguousarray(expected_values, dtype=np.float64)
         
-        # Calculate rolling average if enough data points
+        # Calculate rolling average if enough data points, rolling actual and
+        # expected values together in one call
         if len(stat_values) >= rolling_window:
-            df['rolling_avg'] = df['value'].rolling(window=rolling_window).mean()
             if include_expected:
-                df['expected_rolling_avg'] = df['expected'].rolling(window=rolling_window).mean()
+                rolled = _rolling_mean(df[['value', 'expected']], rolling_window)
+                df['rolling_avg'] = rolled['value']
+                df['expected_rolling_avg'] = rolled['expected']
+            else:
+                df['rolling_avg'] = _rolling_mean(df['value'], rolling_window)
         
         # Create visualization
-        plt.figure(figsize=(14, 8))
-        
-        # Plot actual values
-        plt.plot(df['date'], df['value'], 'o-', color='blue', alpha=0.6, label=f'Actual {stat}')
-        
-        # Plot rolling average if available
-        if 'rolling_avg' in df.columns:
-            plt.plot(df['date'], df['rolling_avg'], '-', color='darkblue', linewidth=2, 
-                   label=f'{rolling_window}-Day Rolling Avg')
-        
-        # Plot expected values if requested
-        if include_expected:
-            plt.plot(df['date'], df['expected'], 'o--', color='red', alpha=0.6, label=f'Expected {stat} (x{stat})')
-            if 'expected_rolling_avg' in df.columns:
-                plt.plot(df['date'], df['expected_rolling_avg'], '--', color='darkred', linewidth=2,
-                       label=f'Expected {rolling_window}-Day Rolling Avg')
-        
-        # Set chart properties
-        plt.title(f"{player_name}: {stat} Trend", fontsize=16)
-        plt.xlabel("Date", fontsize=12)
-        plt.ylabel(stat, fontsize=12)
-        plt.grid(True, linestyle='--', alpha=0.7)
-        plt.legend()
-        
-        # Format date axis
-        plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
-        plt.gca().xaxis.set_major_locator(mdates.AutoDateLocator())
-        plt.gcf().autofmt_xdate()
-        
-        # Add trendline for overall direction
-        z = np.polyfit(range(len(df['value'])), df['value'], 1)
-        p = np.poly1d(z)
-        plt.plot(df['date'], p(range(len(df['value']))), "r--", alpha=0.3, linewidth=1)
-        
-        # Highlight significant changes
-        if len(stat_values) >= 3:
-            last_value = stat_values[-1]
-            avg_value = np.mean(stat_values[:-1])
-            
-            # Calculate percent change
-            if avg_value != 0:
-                percent_change = (last_value - avg_value) / avg_value * 100
+        with self._figure((14, 8)) as fig:
+            ax = fig.add_subplot(111)
+            
+            # Plot actual values
+            ax.plot(df['date'], df['value'], 'o-', color='blue', alpha=0.6, label=f'Actual {stat}')
+            
+            # Plot rolling average if available
+            if 'rolling_avg' in df.columns:
+                ax.plot(df['date'], df['rolling_avg'], '-', color='darkblue', linewidth=2, 
+                       label=f'{rolling_window}-Day Rolling Avg')
+            
+            # Plot expected values if requested
+            if include_expected:
+                ax.plot(df['date'], df['expected'], 'o--', color='red', alpha=0.6, label=f'Expected {stat} (x{stat})')
+                if 'expected_rolling_avg' in df.columns:
+                    ax.plot(df['date'], df['expected_rolling_avg'], '--', color='darkred', linewidth=2,
+                           label=f'Expected {rolling_window}-Day Rolling Avg')
+            
+            # Set chart properties
+            ax.set_title(f"{player_name}: {stat} Trend", fontsize=16)
+            ax.set_xlabel("Date", fontsize=12)
+            ax.set_ylabel(stat, fontsize=12)
+            ax.grid(True, linestyle='--', alpha=0.7)
+            ax.legend()
+            
+            # Format date axis
+            ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
+            ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+            fig.autofmt_xdate()
+            
+            # Add trendline for overall direction
+            trend, last_value, percent_change = _trend_stats(stat_values)
+            ax.plot(df['date'], trend, "r--", alpha=0.3, linewidth=1)
+            
+            # Highlight significant changes
+            if percent_change is not None:
                 direction = "up" if percent_change > 0 else "down"
                 
                 # Add annotation if change is significant (>10%)
                 if abs(percent_change) > 10:
-                    plt.annotate(f"{direction.upper()} {abs(percent_change):.1f}%", 
-                                xy=(df['date'].iloc[-1], last_value),
-                                xytext=(10, 10 if direction == "up" else -10),
-                                textcoords="offset points",
-                                arrowprops=dict(arrowstyle="->", color="green" if direction == "up" else "red"))
-        
-        plt.tight_layout()
-        
-        # Generate filename if not provided
-        if filename is None:
-            player_name_slug = player_name.replace(' ', '_').lower()
-            expected_suffix = "_with_expected" if include_expected else ""
-            filename = f"trend_{player_name_slug}_{stat.lower()}{expected_suffix}.png"
-        
-        # Save the figure
-        output_path = os.path.join(self.output_dir, filename)
-        plt.savefig(output_path)
-        plt.close()
+                    ax.annotate(f"{direction.upper()} {abs(percent_change):.1f}%", 
+                               xy=(df['date'].iloc[-1], last_value),
+                               xytext=(10, 10 if direction == "up" else -10),
+                               textcoords="offset points",
+                               arrowprops=dict(arrowstyle="->", color="green" if direction == "up" else "red"))
+            
+            fig.tight_layout()
+            
+            # Generate filename if not provided
+            if filename is None:
+                player_name_slug = player_name.replace(' ', '_').lower()
+                expected_suffix = "_with_expected" if include_expected else ""
+                filename = f"trend_{player_name_slug}_{stat.lower()}{expected_suffix}.png"
+            
+            # Save the figure
+            output_path = self._output_prefix + filename
+            save_png(fig, output_path)
         
         return output_path
     
+    @_styled_render
     def visualize_player_rolling_stats(
-        self, player_name: str, stats: Dict[str, List[float]], 
+        self, player_name: str, stats: Dict[str, Union[List[float], np.ndarray]], 
         dates: List[str], windows: List[int] = [7, 15, 30],
         filename: Optional[str] = None
     ) -> str:
@@ -152,7 +361,7 @@ class TrendVisualizer:
         
         Args:
             player_name: Name of the player
-            stats: Dictionary of stat names to lists of values
+            stats: Dictionary of stat names to value lists or arrays
             dates: List of date strings corresponding to stat values
             windows: Rolling windows to calculate (in days)
             filename: Output filename
@@ -165,71 +374,70 @@ class TrendVisualizer:
             if len(values) != len(dates):
                 raise ValueError(f"values for {stat_name} and dates must have same length")
         
-        # Convert dates to datetime objects
-        date_objects = [datetime.strptime(date, "%Y-%m-%d") for date in dates]
+        # Parse all dates in one vectorized call, reusing earlier parses
+        date_objects = _parse_dates(tuple(dates))
         
-        # Create DataFrame
-        df = pd.DataFrame({'date': date_objects})
-        for stat_name, values in stats.items():
-            df[stat_name] = values
-        
-        # Calculate rolling averages for each window and stat
-        rolling_data = {}
-        for window in windows:
-            if len(dates) >= window:
-                for stat_name in stats.keys():
-                    df[f'{stat_name}_{window}d'] = df[stat_name].rolling(window=window).mean()
-                    if f'{stat_name}' not in rolling_data:
-                        rolling_data[f'{stat_name}'] = []
-                    rolling_data[f'{stat_name}'].append((window, f'{stat_name}_{window}d'))
+        # One single-precision column per stat (ample for plotting), indexed
+        # by date and built in one shot from the converted arrays
+        stats_df = pd.DataFrame(
+            {stat_name: np.asarray(values, dtype=np.float32) for stat_name, values in stats.items()},
+            index=date_objects, copy=False
+        )
+        
+        # Roll every stat column together, once per window, keeping single precision
+        rolled = [
+            (window, _rolling_mean(stats_df, window).astype(np.float32, copy=False))
+            for window in windows if len(dates) >= window
+        ]
         
         # Create subplots for each stat
         num_stats = len(stats)
-        fig, axs = plt.subplots(num_stats, 1, figsize=(14, 5*num_stats), sharex=True)
-        if num_stats == 1:
-            axs = [axs]  # Make axs a list even if there's only one stat
-        
-        # Plot each stat
-        for i, (stat_name, values) in enumerate(stats.items()):
-            # Plot raw values with low opacity
-            axs[i].plot(df['date'], df[stat_name], 'o-', color='gray', alpha=0.3, label=f'Daily {stat_name}')
-            
-            # Plot rolling averages if available
-            if stat_name in rolling_data:
-                for window, col_name in rolling_data[stat_name]:
-                    axs[i].plot(df['date'], df[col_name], '-', linewidth=2, label=f'{window}-Day Avg')
-            
-            # Set subplot properties
-            axs[i].set_title(f"{stat_name}", fontsize=14)
-            axs[i].set_ylabel(stat_name, fontsize=12)
-            axs[i].grid(True, linestyle='--', alpha=0.7)
-            axs[i].legend(loc='upper left')
+        with self._figure((14, 5*num_stats)) as fig:
+            axs = fig.subplots(num_stats, 1, sharex=True)
+            if num_stats == 1:
+                axs = [axs]  # Make axs a list even if there's only one stat
             
-            # Format date axis
-            axs[i].xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
-            axs[i].xaxis.set_major_locator(mdates.AutoDateLocator())
-        
-        plt.suptitle(f"{player_name}: Rolling Performance", fontsize=16)
-        plt.xlabel("Date", fontsize=12)
-        fig.autofmt_xdate()
-        plt.tight_layout()
-        
-        # Generate filename if not provided
-        if filename is None:
-            player_name_slug = player_name.replace(' ', '_').lower()
-            stats_slug = '_'.join(list(stats.keys())[:2]).lower()  # Use first two stats in filename
-            filename = f"rolling_stats_{player_name_slug}_{stats_slug}.png"
-        
-        # Save the figure
-        output_path = os.path.join(self.output_dir, filename)
-        plt.savefig(output_path)
-        plt.close()
+            # Plot each stat
+            for i, (stat_name, values) in enumerate(stats.items()):
+                # Plot raw values with low opacity
+                axs[i].plot(stats_df.index, stats_df[stat_name], 'o-', color='gray', alpha=0.3, label=f'Daily {stat_name}')
+                
+                # Plot rolling averages if available
+                for window, rolled_df in rolled:
+                    axs[i].plot(stats_df.index, rolled_df[stat_name], '-', linewidth=2, label=f'{window}-Day Avg')
+                
+                # Set subplot properties
+                axs[i].set_title(f"{stat_name}", fontsize=14)
+                axs[i].set_ylabel(stat_name, fontsize=12)
+                axs[i].grid(True, linestyle='--', alpha=0.7)
+                axs[i].legend(loc='upper left')
+            
+            # Format date axis; the subplots share x, so one formatter and
+            # locator serve them all
+            axs[-1].xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
+            axs[-1].xaxis.set_major_locator(mdates.AutoDateLocator())
+            
+            fig.suptitle(f"{player_name}: Rolling Performance", fontsize=16)
+            axs[-1].set_xlabel("Date", fontsize=12)
+            fig.autofmt_xdate()
+            fig.tight_layout()
+            
+            # Generate filename if not provided
+            if filename is None:
+                player_name_slug = player_name.replace(' ', '_').lower()
+                stats_slug = '_'.join(list(stats.keys())[:2]).lower()  # Use first two stats in filename
+                filename = f"rolling_stats_{player_name_slug}_{stats_slug}.png"
+            
+            # Save the figure
+            output_path = self._output_prefix + filename
+            save_png(fig, output_path)
         
         return output_path
     
+    @_styled_render
     def visualize_stat_distribution(
         self, player_name: str, stat: str, player_value: float,
-        comparison_values: List[float], timeframe: str = "Season",
+        comparison_values: Union[List[float], np.ndarray], timeframe: str = "Season",
         filename: Optional[str] = None
     ) -> str:
         """
@@ -239,57 +447,68 @@ class TrendVisualizer:
             player_name: Name of the player
             stat: Name of the statistic being visualized
             player_value: Player's value for the stat
-            comparison_values: List of values from other players/league for comparison
+            comparison_values: Values from other players/league for comparison (list or array)
             timeframe: Timeframe of the data (e.g., "Season", "Last 30 Days")
             filename: Output filename
             
         Returns:
             str: Path to generated image
         """
-        plt.figure(figsize=(12, 6))
-        
-        # Create histogram/KDE of league distribution
-        sns.histplot(comparison_values, kde=True, color='skyblue', alpha=0.5)
-        
-        # Add vertical line for player's value
-        plt.axvline(x=player_value, color='red', linestyle='--', linewidth=2, 
-                   label=f'{player_name}: {player_value}')
-        
-        # Calculate percentile
-        percentile = sum(v < player_value for v in comparison_values) / len(comparison_values) * 100
-        
-        # Set chart properties
-        plt.title(f"{player_name}: {stat} vs. League ({timeframe})", fontsize=16)
-        plt.xlabel(stat, fontsize=12)
-        plt.ylabel("Frequency", fontsize=12)
-        plt.grid(True, linestyle='--', alpha=0.7)
-        
-        # Add percentile annotation
-        plt.annotate(f"{percentile:.1f}th Percentile", 
-                    xy=(player_value, 0),
-                    xytext=(0, 20),
-                    textcoords="offset points",
-                    ha='center',
-                    arrowprops=dict(arrowstyle="->", color="red"))
-        
-        plt.legend()
-        plt.tight_layout()
-        
-        # Generate filename if not provided
-        if filename is None:
-            player_name_slug = player_name.replace(' ', '_').lower()
-            timeframe_slug = timeframe.replace(' ', '_').lower()
-            filename = f"distribution_{player_name_slug}_{stat.lower()}_{timeframe_slug}.png"
-        
-        # Save the figure
-        output_path = os.path.join(self.output_dir, filename)
-        plt.savefig(output_path)
-        plt.close()
+        with self._figure((12, 6)) as fig:
+            ax = fig.add_subplot(111)
+            
+            # Create histogram/KDE of league distribution from one float array
+            values = np.ascontiguousarray(comparison_values, dtype=np.float64)
+            values = values[np.isfinite(values)]
+            _, edges, _ = ax.hist(values, bins='auto', color='skyblue', alpha=0.5, edgecolor='white')
+            
+            # Overlay the KDE, scaled from density to bin counts
+            kde = _kde_curve(values)
+            if kde is not None:
+                support, density = kde
+                ax.plot(support, density * len(values) * np.diff(edges).mean(), color='skyblue')
+            
+            # Add vertical line for player's value
+            ax.axvline(x=player_value, color='red', linestyle='--', linewidth=2, 
+                      label=f'{player_name}: {player_value}')
+            
+            # Calculate percentile
+            percentile = self._percentile_rank(
+                player_value, np.sort(np.asarray(comparison_values, dtype=np.float64))
+            )
+            
+            # Set chart properties
+            ax.set_title(f"{player_name}: {stat} vs. League ({timeframe})", fontsize=16)
+            ax.set_xlabel(stat, fontsize=12)
+            ax.set_ylabel("Frequency", fontsize=12)
+            ax.grid(True, linestyle='--', alpha=0.7)
+            
+            # Add percentile annotation
+            ax.annotate(f"{percentile:.1f}th Percentile", 
+                       xy=(player_value, 0),
+                       xytext=(0, 20),
+                       textcoords="offset points",
+                       ha='center',
+                       arrowprops=dict(arrowstyle="->", color="red"))
+            
+            ax.legend()
+            fig.tight_layout()
+            
+            # Generate filename if not provided
+            if filename is None:
+                player_name_slug = player_name.replace(' ', '_').lower()
+                timeframe_slug = timeframe.replace(' ', '_').lower()
+                filename = f"distribution_{player_name_slug}_{stat.lower()}_{timeframe_slug}.png"
+            
+            # Save the figure
+            output_path = self._output_prefix + filename
+            save_png(fig, output_path)
         
         return output_path
     
+    @_styled_render
     def visualize_multistat_comparison(
-        self, player_name: str, stats: Dict[str, Tuple[float, List[float]]],
+        self, player_name: str, stats: Dict[str, Tuple[float, Union[List[float], np.ndarray]]],
         timeframe: str = "Season", filename: Optional[str] = None
     ) -> str:
         """
@@ -304,48 +523,75 @@ class TrendVisualizer:
         Returns:
             str: Path to generated image
         """
-        # Calculate percentiles for each stat
-        percentiles = {}
-        for stat_name, (player_value, comparison_values) in stats.items():
-            percentile = sum(v < player_value for v in comparison_values) / len(comparison_values) * 100
-            percentiles[stat_name] = percentile
+        # Calculate percentiles for each stat straight into the plotting columns;
+        # stats sharing one comparison list sort it once within this call
+        names = list(stats)
+        pcts = np.empty(len(names), dtype=np.float64)
+        sorted_arrays = {}
+        for i, (player_value, comparison_values) in enumerate(stats.values()):
+            sorted_values = sorted_arrays.get(id(comparison_values))
+            if sorted_values is None:
+                sorted_values = np.sort(np.asarray(comparison_values, dtype=np.float64))
+                sorted_arrays[id(comparison_values)] = sorted_values
+            pcts[i] = self._percentile_rank(player_value, sorted_values)
         
         # Create DataFrame for visualization
-        df = pd.DataFrame({
-            'Stat': list(percentiles.keys()),
-            'Percentile': list(percentiles.values())
-        })
+        df = pd.DataFrame({'Stat': names, 'Percentile': pcts})
         
         # Create visualization
-        plt.figure(figsize=(12, 8))
-        bars = sns.barplot(x='Stat', y='Percentile', data=df, palette='viridis')
-        
-        # Add percentile values on top of bars
-        for i, p in enumerate(bars.patches):
-            bars.text(p.get_x() + p.get_width()/2., p.get_height() + 1,
-                     f'{df["Percentile"].iloc[i]:.1f}%', ha="center")
-        
-        # Add a horizontal line at 50th percentile
-        plt.axhline(y=50, color='r', linestyle='--', alpha=0.7, label='League Average (50th Percentile)')
-        
-        # Set chart properties
-        plt.title(f"{player_name}: Percentile Rankings ({timeframe})", fontsize=16)
-        plt.xlabel("Statistic", fontsize=12)
-        plt.ylabel("Percentile Rank", fontsize=12)
-        plt.ylim(0, 100)
-        plt.grid(True, axis='y', linestyle='--', alpha=0.7)
-        plt.legend()
-        plt.tight_layout()
-        
-        # Generate filename if not provided
-        if filename is None:
-            player_name_slug = player_name.replace(' ', '_').lower()
-            timeframe_slug = timeframe.replace(' ', '_').lower()
-            filename = f"percentile_rankings_{player_name_slug}_{timeframe_slug}.png"
-        
-        # Save the figure
-        output_path = os.path.join(self.output_dir, filename)
-        plt.savefig(output_path)
-        plt.close()
-        
-        return output_path
\ No newline at end of file
+        with self._figure((12, 8)) as fig:
+            ax = fig.add_subplot(111)
+            bars = sns.barplot(x='Stat', y='Percentile', data=df, palette='viridis', ax=ax)
+            
+            # Add percentile values on top of bars; the label positions come from
+            # one array and every label shares a single resolved font
+            label_values = pcts
+            label_x = [p.get_x() + p.get_width()/2. for p in bars.patches]
+            label_font = FontProperties()
+            for x, y, value in zip(label_x, label_values + 1, label_values):
+                ax.text(x, y, f'{value:.1f}%', ha="center", fontproperties=label_font)
+            
+            # Add a horizontal line at 50th percentile
+            ax.axhline(y=50, color='r', linestyle='--', alpha=0.7, label='League Average (50th Percentile)')
+            
+            # Set chart properties
+            ax.set_title(f"{player_name}: Percentile Rankings ({timeframe})", fontsize=16)
+            ax.set_xlabel("Statistic", fontsize=12)
+            ax.set_ylabel("Percentile Rank", fontsize=12)
+            ax.set_ylim(0, 100)
+            ax.grid(True, axis='y', linestyle='--', alpha=0.7)
+            ax.legend()
+            fig.tight_layout()
+            
+            # Generate filename if not provided
+            if filename is None:
+                player_name_slug = player_name.replace(' ', '_').lower()
+                timeframe_slug = timeframe.replace(' ', '_').lower()
+                filename = f"percentile_rankings_{player_name_slug}_{timeframe_slug}.png"
+            
+            # Save the figure
+            output_path = self._output_prefix + filename
+            save_png(fig, output_path)
+        
+        return output_path
+
+# Visualizers created in a worker process, keyed by output directory, so
+# consecutive jobs reuse one set of cached figures
+_WORKER_VISUALIZERS: Dict[str, TrendVisualizer] = {}
+
+def _render_player_trend(args: Tuple[str, Dict[str, Any]]) -> str:
+    """
+    Render one player trend chart in a worker process.
+    
+    Args:
+        args: (output directory, keyword arguments for visualize_player_trend)
+        
+    Returns:
+        str: Path to generated image
+    """
+    output_dir, job = args
+    visualizer = _WORKER_VISUALIZERS.get(output_dir)
+    if visualizer is None:
+        visualizer = TrendVisualizer(output_dir)
+        _WORKER_VISUALIZERS[output_dir] = visualizer
+    return visualizer.visualize_player_trend(**job)
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from src.visualization.trend_charts import TrendVisualizer
+
+
+@pytest.fixture
+def visualizer(tmp_path):
+    return TrendVisualizer(output_dir=str(tmp_path))
+
+
+@pytest.fixture
+def recorded_ranks(monkeypatch):
+    """Record every percentile computed by TrendVisualizer._percentile_rank."""
+    ranks = []
+    original = TrendVisualizer._percentile_rank
+
+    def record(player_value, sorted_values):
+        rank = original(player_value, sorted_values)
+        ranks.append(rank)
+        return rank
+
+    monkeypatch.setattr(TrendVisualizer, '_percentile_rank', staticmethod(record))
+    return ranks
+
+
+def test_percentile_rank_counts_values_strictly_below():
+    sorted_values = np.sort(np.array([0.1, 0.3, 0.2, 0.2]))
+    assert TrendVisualizer._percentile_rank(0.2, sorted_values) == 25.0
+    assert TrendVisualizer._percentile_rank(0.05, sorted_values) == 0.0
+    assert TrendVisualizer._percentile_rank(0.5, sorted_values) == 100.0
+
+
+def test_percentile_rank_of_nan_is_zero():
+    sorted_values = np.sort(np.array([0.1, np.nan, 0.3, 0.2]))
+    assert TrendVisualizer._percentile_rank(np.nan, sorted_values) == 0.0
+
+
+def test_multistat_comparison_sees_list_mutated_in_place(visualizer, recorded_ranks):
+    values = [1.0, 2.0, 3.0, 4.0]
+    visualizer.visualize_multistat_comparison('Player', {'AVG': (3.0, values)})
+
+    values[0] = 10.0
+    values[1] = 11.0
+    visualizer.visualize_multistat_comparison('Player', {'AVG': (3.0, values)})
+
+    assert recorded_ranks == [50.0, 0.0]
+
+
+def test_stat_distribution_sees_array_refilled_in_place(visualizer, recorded_ranks):
+    values = np.array([1.0, 2.0, 3.0, 4.0])
+    visualizer.visualize_stat_distribution('Player', 'AVG', 3.0, values)
+
+    values[:] = [5.0, 6.0, 7.0, 8.0]
+    visualizer.visualize_stat_distribution('Player', 'AVG', 3.0, values)
+
+    assert recorded_ranks == [50.0, 0.0]